@@ -1,3 +1,4 @@
+using System.Text.RegularExpressions;
 using ibsCompiler.Configuration;
 
 namespace ibsCompiler
@@ -21,6 +22,16 @@ namespace ibsCompiler
             }
         }
 
+        // Password patterns, applied in order. Built once here rather than re-resolved through
+        // Regex's static cache on every changelog line.
+        private static readonly Regex[] PasswordPatterns =
+        {
+            new(@"(-P\s+)\S+", RegexOptions.IgnoreCase),              // -P password (space-separated)
+            new(@"(-P=|--password=)\S+", RegexOptions.IgnoreCase),     // -P=password or --password=value
+            new(@"(PASSWORD\s*=\s*)\S+", RegexOptions.IgnoreCase),    // PASSWORD=value (e.g. in connection strings)
+            new(@"(pwd\s*=\s*)\S+", RegexOptions.IgnoreCase)          // pwd=value (e.g. in connection strings)
+        };
+
         /// <summary>
         /// Mask any password values in a string with ****.
         /// Handles common patterns: -P password, -P=password, PASSWORD=value
@@ -29,21 +40,8 @@ namespace ibsCompiler
         {
             if (string.IsNullOrEmpty(value)) return value;
 
-            // -P password (space-separated)
-            value = System.Text.RegularExpressions.Regex.Replace(
-                value, @"(-P\s+)\S+", "$1****", System.Text.RegularExpressions.RegexOptions.IgnoreCase);
-
-            // -P=password or --password=value
-            value = System.Text.RegularExpressions.Regex.Replace(
-                value, @"(-P=|--password=)\S+", "$1****", System.Text.RegularExpressions.RegexOptions.IgnoreCase);
-
-            // PASSWORD=value (e.g. in connection strings)
-            value = System.Text.RegularExpressions.Regex.Replace(
-                value, @"(PASSWORD\s*=\s*)\S+", "$1****", System.Text.RegularExpressions.RegexOptions.IgnoreCase);
-
-            // pwd=value (e.g. in connection strings)
-            value = System.Text.RegularExpressions.Regex.Replace(
-                value, @"(pwd\s*=\s*)\S+", "$1****", System.Text.RegularExpressions.RegexOptions.IgnoreCase);
+            foreach (var pattern in PasswordPatterns)
+                value = pattern.Replace(value, "$1****");
 
             return value;
         }
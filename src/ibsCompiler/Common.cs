@@ -1,3 +1,5 @@
+using System.Collections.Concurrent;
+using System.IO.Enumeration;
 using System.Text.RegularExpressions;
 using ibsCompiler.Configuration;
 
@@ -14,6 +16,16 @@ namespace ibsCompiler
         public static string DefaultOutFile { get; set; } = "";
         public static string DefaultErrFile { get; set; } = "";
 
+        // When set, console-bound WriteLine output from the current flow (thread or async
+        // continuation) is collected here instead of printed. transfer_data uses it so each
+        // parallel table's executor progress is printed with that table's result.
+        private static readonly AsyncLocal<System.Text.StringBuilder?> _capturedOutput = new();
+        public static System.Text.StringBuilder? CapturedOutput
+        {
+            get => _capturedOutput.Value;
+            set => _capturedOutput.Value = value;
+        }
+
         #region Platform parsing
         /// <summary>
         /// Canonicalizes a platform string to a SQLServerTypes value.
@@ -207,6 +219,8 @@ namespace ibsCompiler
             var target = !string.IsNullOrWhiteSpace(outputFile) ? outputFile : DefaultOutFile;
             if (!string.IsNullOrWhiteSpace(target))
                 WriteLineToDisk(target, text);
+            else if (CapturedOutput is { } captured)
+                captured.AppendLine(text);
             else if (OutputToStdErr)
                 Console.Error.WriteLine(text);
             else
@@ -225,10 +239,23 @@ namespace ibsCompiler
         /// <summary>
         /// Opens a StreamWriter for any committed CSS source file (messages, options,
         /// actions, required_fields, table_locations, etc). Forces LF terminators so
-        /// files are byte-identical regardless of host OS.
+        /// files are byte-identical regardless of host OS. Bulk-copy extracts pass
+        /// DataFileBufferSize so million-row files go out in large writes.
+        /// </summary>
+        public static StreamWriter OpenSourceWriter(string path, bool append = false, int bufferSize = 0)
+        {
+            var writer = bufferSize > 0
+                ? new StreamWriter(path, append, new System.Text.UTF8Encoding(false), bufferSize)
+                : new StreamWriter(path, append);
+            writer.NewLine = "\n";
+            return writer;
+        }
+
+        /// <summary>
+        /// Buffer size for bulk-copy data files, and for the option files and resolved
+        /// options cache read on every compile, so each is read in a few large reads.
         /// </summary>
-        public static StreamWriter OpenSourceWriter(string path, bool append = false)
-            => new StreamWriter(path, append) { NewLine = "\n" };
+        public const int DataFileBufferSize = 1 << 16;
 
         /// <summary>
         /// Seconds since the SBN epoch (1980-01-01), the int form used by
@@ -250,34 +277,96 @@ namespace ibsCompiler
         #endregion
 
         #region File utilities
+        // (working directory, requested name) -> resolved path. runcreate runs the same script
+        // once per target database and nested create files repeat paths, so a repeat lookup
+        // skips the probe chain and case-insensitive walk. Only resolutions that fell past the
+        // exact name are cached (an exact hit is a single stat anyway), stamped with the last
+        // write time of every directory a higher-priority candidate could appear in: the
+        // requested name's, the linked name's, and the match's own. A file created or removed
+        // there (an exact-name file, a second wildcard match) bumps the stamp, and the name is
+        // resolved again.
+        private static readonly ConcurrentDictionary<(string Cwd, string Name), (string Path, (string Dir, DateTime Stamp)[] Dirs)> _foundFiles = new();
+
         public static bool FindFile(ref string fileName)
+        {
+            var key = (Directory.GetCurrentDirectory(), fileName);
+            if (_foundFiles.TryGetValue(key, out var found))
+            {
+                if (Array.TrueForAll(found.Dirs, d => Directory.GetLastWriteTimeUtc(d.Dir) == d.Stamp) && File.Exists(found.Path))
+                {
+                    fileName = found.Path;
+                    return true;
+                }
+                _foundFiles.TryRemove(key, out _);
+            }
+
+            // The exact name wins outright and needs no entry. Otherwise stamp the candidate
+            // directories before probing, so a file that appears meanwhile still invalidates it.
+            var normalized = fileName.Replace('\\', Path.DirectorySeparatorChar).Replace('/', Path.DirectorySeparatorChar);
+            if (File.Exists(normalized)) { fileName = normalized; return true; }
+            var dirs = new List<(string Dir, DateTime Stamp)>();
+            StampDirectoryOf(dirs, normalized);
+            StampDirectoryOf(dirs, NonLinkedFilename(normalized));
+
+            if (!FindFileUncached(ref fileName)) return false;
+            if (!string.Equals(fileName, normalized, StringComparison.Ordinal))
+            {
+                StampDirectoryOf(dirs, fileName);
+                _foundFiles[key] = (fileName, dirs.ToArray());
+            }
+            return true;
+        }
+
+        private static void StampDirectoryOf(List<(string Dir, DateTime Stamp)> dirs, string path)
+        {
+            var dir = Path.GetDirectoryName(path);
+            if (string.IsNullOrEmpty(dir)) dir = ".";
+            if (!dirs.Exists(d => d.Dir == dir))
+                dirs.Add((dir, Directory.GetLastWriteTimeUtc(dir)));
+        }
+
+        private static bool FindFileUncached(ref string fileName)
         {
             // Normalize path separators for current platform
             fileName = fileName.Replace('\\', Path.DirectorySeparatorChar).Replace('/', Path.DirectorySeparatorChar);
 
+            // Names that already end in .sql never get a second extension, so their ".sql"
+            // probes are skipped; otherwise each variant is built once and reused below.
+            var hasSqlExt = fileName.EndsWith(".sql", StringComparison.OrdinalIgnoreCase);
+            var withSql = hasSqlExt ? null : fileName + ".sql";
+
             if (File.Exists(fileName)) return true;
-            if (File.Exists(fileName + ".sql")) { fileName += ".sql"; return true; }
+            if (withSql != null && File.Exists(withSql)) { fileName = withSql; return true; }
 
+            // Most names carry no linked-path prefix; then fn is the same path and probing it
+            // again would only repeat the two stats above.
             var fn = NonLinkedFilename(fileName);
-            if (File.Exists(fn)) { fileName = fn; return true; }
-            if (File.Exists(fn + ".sql")) { fileName = fn + ".sql"; return true; }
+            var linked = !string.Equals(fn, fileName, StringComparison.Ordinal);
+            var fnWithSql = linked && !hasSqlExt ? fn + ".sql" : null;
+            if (linked && File.Exists(fn)) { fileName = fn; return true; }
+            if (fnWithSql != null && File.Exists(fnWithSql)) { fileName = fnWithSql; return true; }
 
-            // Wildcard lookup
+            // Wildcard lookup. A name without '*' or '?' can only match itself, which the
+            // File.Exists probes above already ruled out, so don't read the directory for it.
             var dir = Path.GetDirectoryName(fileName);
             var file = Path.GetFileName(fileName);
             if (string.IsNullOrEmpty(dir)) dir = ".";
-            try
+            if (file.AsSpan().IndexOfAny('*', '?') >= 0)
             {
-                var files = Directory.GetFiles(dir, file);
-                if (files.Length == 1)
+                try
                 {
-                    fileName = files[0];
-                    if (fileName.StartsWith("." + Path.DirectorySeparatorChar))
-                        fileName = fileName.Substring(2);
-                    return true;
+                    // Only "exactly one match" matters, so stop enumerating at the second.
+                    var files = Directory.EnumerateFiles(dir, file).Take(2).ToArray();
+                    if (files.Length == 1)
+                    {
+                        fileName = files[0];
+                        if (fileName.StartsWith("." + Path.DirectorySeparatorChar))
+                            fileName = fileName.Substring(2);
+                        return true;
+                    }
                 }
+                catch { }
             }
-            catch { }
 
             // Case-insensitive walk: legacy Unix create-files use lowercase "css>ss>ba>..."
             // but the real directories on disk are mixed-case ("CSS/ss/ba/..."). On NTFS/DrvFs
@@ -289,17 +378,17 @@ namespace ibsCompiler
                 fileName = resolved;
                 return true;
             }
-            if (TryResolveCaseInsensitive(fileName + ".sql", out resolved))
+            if (withSql != null && TryResolveCaseInsensitive(withSql, out resolved))
             {
                 fileName = resolved;
                 return true;
             }
-            if (TryResolveCaseInsensitive(fn, out resolved))
+            if (linked && TryResolveCaseInsensitive(fn, out resolved))
             {
                 fileName = resolved;
                 return true;
             }
-            if (TryResolveCaseInsensitive(fn + ".sql", out resolved))
+            if (fnWithSql != null && TryResolveCaseInsensitive(fnWithSql, out resolved))
             {
                 fileName = resolved;
                 return true;
@@ -311,13 +400,13 @@ namespace ibsCompiler
         /// Walk <paramref name="path"/> component-by-component, matching each directory and
         /// the file name case-insensitively against what is actually on disk. Returns true
         /// (and writes the on-disk path to <paramref name="resolved"/>) only when every
-        /// segment resolves to a unique match.
+        /// segment resolves to a unique match. Callers have already tried
+        /// <paramref name="path"/> as given, so the exact-case stat is not repeated here.
         /// </summary>
         private static bool TryResolveCaseInsensitive(string path, out string resolved)
         {
             resolved = path;
             if (string.IsNullOrEmpty(path)) return false;
-            if (File.Exists(path)) return true;
 
             var isAbsolute = Path.IsPathRooted(path);
             var root = isAbsolute ? Path.GetPathRoot(path) ?? string.Empty : string.Empty;
@@ -333,28 +422,10 @@ namespace ibsCompiler
 
             for (int i = 0; i < parts.Length; i++)
             {
-                if (!Directory.Exists(current)) return false;
-                var wantFile = i == parts.Length - 1;
-                string match = null;
-                try
-                {
-                    if (wantFile)
-                    {
-                        foreach (var f in Directory.EnumerateFiles(current))
-                        {
-                            if (string.Equals(Path.GetFileName(f), parts[i], StringComparison.OrdinalIgnoreCase))
-                            { match = f; break; }
-                        }
-                    }
-                    if (match == null)
-                    {
-                        foreach (var d in Directory.EnumerateDirectories(current))
-                        {
-                            if (string.Equals(Path.GetFileName(d), parts[i], StringComparison.OrdinalIgnoreCase))
-                            { match = d; break; }
-                        }
-                    }
-                }
+                // The last segment must be a file, every earlier one a directory. A missing
+                // or unreadable directory throws and counts as no match.
+                string? match;
+                try { match = FindEntryIgnoreCase(current, parts[i], wantFile: i == parts.Length - 1); }
                 catch { return false; }
                 if (match == null) return false;
                 current = match;
@@ -363,46 +434,119 @@ namespace ibsCompiler
             return File.Exists(resolved);
         }
 
-        public static string NonLinkedFilename(string argFilename)
+        // Same entries Directory.EnumerateFiles/EnumerateDirectories see (hidden and system
+        // entries included, inaccessible ones throw).
+        private static readonly EnumerationOptions AllEntries = new() { AttributesToSkip = 0, IgnoreInaccessible = false };
+
+        // Full directory path -> (last write time, name -> first file / first directory with
+        // that name ignoring case). A create file resolves hundreds of scripts through the
+        // same few directories; a cached listing costs one stat to validate instead of a
+        // full directory read. Adding, removing or renaming an entry bumps the directory's
+        // write time, so a changed directory is simply listed again.
+        private static readonly ConcurrentDictionary<string, (DateTime Stamp, Dictionary<string, (string? File, string? Dir)> Names)> _dirListings = new();
+
+        /// <summary>
+        /// First file (or directory) in <paramref name="directory"/> whose name matches
+        /// <paramref name="name"/> ignoring case, as directory + name. Served from a cached
+        /// listing while the directory's write time is unchanged.
+        /// </summary>
+        private static string? FindEntryIgnoreCase(string directory, string name, bool wantFile)
         {
-            string[,] ConvertPaths =
+            var key = Path.GetFullPath(directory);
+            var stamp = Directory.GetLastWriteTimeUtc(key);
+            if (!_dirListings.TryGetValue(key, out var listing) || listing.Stamp != stamp)
             {
-                {@"[\\/]ss[\\/]api[\\/]",    Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Application_Program_Interface" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]api2[\\/]",   Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Application_Program_Interface_V2" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]api3[\\/]",   Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Application_Program_Interface_V3" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]at[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Alarm_Treatment" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]ba[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Basics" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]bl[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Billing" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]ct[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Create_Temp" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]cv[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Conversions" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]da[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "da" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]dv[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "IBS_Development" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]fe[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Front_End" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]in[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Internal" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]ma[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Co_Monitoring" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]mb[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Mobile" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]mo[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Monitoring" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]mobile[\\/]", Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Mobile" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]sdi[\\/]",    Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "SDI_App" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]si[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "System_Init" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]sv[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Service" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]tm[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Telemarketing" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]test[\\/]",   Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Test" + Path.DirectorySeparatorChar},
-                {@"[\\/]ss[\\/]ub[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "US_Basics" + Path.DirectorySeparatorChar},
-                {@"[\\/]ibs[\\/]ss[\\/]",    Path.DirectorySeparatorChar + "IBS" + Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar}
-            };
-
-            int orgLength = argFilename.Length;
-            if (Regex.IsMatch(argFilename, @"([\\/])(css|ibs)([\\/])", RegexOptions.IgnoreCase))
+                listing = (stamp, ListDirectoryIgnoreCase(key));
+                _dirListings[key] = listing;
+            }
+            if (!listing.Names.TryGetValue(name, out var entry)) return null;
+            var match = wantFile ? entry.File : entry.Dir;
+            return match == null ? null : Path.Join(directory, match);
+        }
+
+        // One pass over the directory, keeping the first file and the first directory seen for
+        // each case-insensitive name (the order a direct scan would have matched them in).
+        // Throws if the directory is missing or unreadable.
+        private static Dictionary<string, (string? File, string? Dir)> ListDirectoryIgnoreCase(string directory)
+        {
+            var names = new Dictionary<string, (string? File, string? Dir)>(StringComparer.OrdinalIgnoreCase);
+            var entries = new FileSystemEnumerable<(string Name, bool IsDir)>(directory,
+                (ref FileSystemEntry entry) => (entry.FileName.ToString(), entry.IsDirectory), AllEntries);
+            foreach (var (entryName, isDir) in entries)
+            {
+                names.TryGetValue(entryName, out var known);
+                if (isDir && known.Dir == null) names[entryName] = (known.File, entryName);
+                else if (!isDir && known.File == null) names[entryName] = (entryName, known.Dir);
+            }
+            return names;
+        }
+
+        // Symbolic short directory -> real directory, in priority order. Built once, with each
+        // pattern constructed up front, rather than on every FindFile miss.
+        private static readonly string[,] ConvertPaths =
+        {
+            {@"[\\/]ss[\\/]api[\\/]",    Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Application_Program_Interface" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]api2[\\/]",   Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Application_Program_Interface_V2" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]api3[\\/]",   Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Application_Program_Interface_V3" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]at[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Alarm_Treatment" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]ba[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Basics" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]bl[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Billing" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]ct[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Create_Temp" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]cv[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Conversions" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]da[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "da" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]dv[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "IBS_Development" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]fe[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Front_End" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]in[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Internal" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]ma[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Co_Monitoring" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]mb[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Mobile" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]mo[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Monitoring" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]mobile[\\/]", Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Mobile" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]sdi[\\/]",    Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "SDI_App" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]si[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "System_Init" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]sv[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Service" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]tm[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Telemarketing" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]test[\\/]",   Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "Test" + Path.DirectorySeparatorChar},
+            {@"[\\/]ss[\\/]ub[\\/]",     Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar + "US_Basics" + Path.DirectorySeparatorChar},
+            {@"[\\/]ibs[\\/]ss[\\/]",    Path.DirectorySeparatorChar + "IBS" + Path.DirectorySeparatorChar + "SQL_Sources" + Path.DirectorySeparatorChar}
+        };
+
+        private static readonly Regex[] ConvertPathRegexes = Enumerable.Range(0, ConvertPaths.GetLength(0))
+            .Select(i => new Regex(ConvertPaths[i, 0], RegexOptions.IgnoreCase))
+            .ToArray();
+
+        // Every ConvertPaths pattern as one zero-width alternation (group i+1 = entry i), so a
+        // single scan finds all candidate entries, overlapping ones included ("/ibs/ss/ba/").
+        private static readonly Regex ConvertPathScan = new(
+            "(?=(?:" + string.Join("|", Enumerable.Range(0, ConvertPaths.GetLength(0)).Select(i => "(" + ConvertPaths[i, 0] + ")")) + "))",
+            RegexOptions.IgnoreCase);
+
+        private static readonly Regex SourceRootRegex = new(@"([\\/])(css|ibs)([\\/])", RegexOptions.IgnoreCase);
+
+        // The conversion is a pure function of the name; scripts that reference the same
+        // files again (runcreate, upgrades) get the answer without another scan.
+        private static readonly ConcurrentDictionary<string, string> _nonLinkedFilenames = new();
+
+        public static string NonLinkedFilename(string argFilename)
+            => _nonLinkedFilenames.GetOrAdd(argFilename, ConvertNonLinkedFilename);
+
+        private static string ConvertNonLinkedFilename(string argFilename)
+        {
+            if (!SourceRootRegex.IsMatch(argFilename))
+                return argFilename;
+
+            // The first table entry present wins (table order, not position in the path), and
+            // all of its occurrences are rewritten.
+            int best = int.MaxValue;
+            for (var m = ConvertPathScan.Match(argFilename); m.Success; m = m.NextMatch())
             {
-                for (int i = 0; i < ConvertPaths.GetLength(0); ++i)
+                for (int g = 1; g < m.Groups.Count && g - 1 < best; g++)
                 {
-                    argFilename = Regex.Replace(argFilename, ConvertPaths[i, 0], ConvertPaths[i, 1], RegexOptions.IgnoreCase);
-                    if (argFilename.Length != orgLength)
-                        return argFilename;
+                    if (m.Groups[g].Success) { best = g - 1; break; }
                 }
             }
-            return argFilename;
+            return best == int.MaxValue
+                ? argFilename
+                : ConvertPathRegexes[best].Replace(argFilename, ConvertPaths[best, 1]);
         }
 
         /// <summary>
@@ -496,9 +640,17 @@ namespace ibsCompiler
         /// simply skip because their targets aren't on disk in a SQL checkout.
         /// </summary>
         public static IReadOnlyList<(string Link, string Target)> ShortcutDefinitionsFor(string sqlSource)
+            => ShortcutDefinitionsFor(sqlSource, out _);
+
+        /// <summary>
+        /// As above; <paramref name="fromScript"/> reports whether create_links.sh supplied
+        /// the list, so callers that label the source don't parse the script a second time.
+        /// </summary>
+        public static IReadOnlyList<(string Link, string Target)> ShortcutDefinitionsFor(string sqlSource, out bool fromScript)
         {
             var parsed = ParseCreateLinks(sqlSource);
-            return parsed.Count > 0 ? parsed : SymlinkDefinitions;
+            fromScript = parsed.Count > 0;
+            return fromScript ? parsed : SymlinkDefinitions;
         }
 
         /// <summary>
@@ -749,7 +901,7 @@ namespace ibsCompiler
                 try
                 {
                     using var fs = new FileStream(sourceFile, FileMode.Open, FileAccess.Read,
-                        FileShare.ReadWrite | FileShare.Delete);
+                        FileShare.ReadWrite | FileShare.Delete, DataFileBufferSize, FileOptions.SequentialScan);
                     using var source = new StreamReader(fs);
                     string? line;
                     while ((line = source.ReadLine()) != null)
@@ -766,7 +918,13 @@ namespace ibsCompiler
         #endregion
 
         #region Temp files
-        public static string GetTempPath()
+        // The temp directory is checked (and created when needed) once per run; temp files
+        // are requested per message type and per batch, and the answer doesn't change.
+        private static string? _tempPath;
+
+        public static string GetTempPath() => _tempPath ??= ResolveTempPath();
+
+        private static string ResolveTempPath()
         {
             var mypath = Path.GetTempPath();
             if (mypath.Contains(' '))
@@ -949,7 +1107,7 @@ namespace ibsCompiler
             {
                 foreach (var arg in arguments)
                 {
-                    if (arg.Length > 1 && arg.Substring(0, 2).ToUpper() == "-S")
+                    if (arg.StartsWith("-S", StringComparison.OrdinalIgnoreCase))
                         myargs.Server = arg.Substring(2);
                 }
                 if (myargs.Server == "") myargs.Server = arguments[arguments.Count - 1];
@@ -1027,7 +1185,7 @@ namespace ibsCompiler
             {
                 foreach (var arg in arguments)
                 {
-                    if (arg.Length > 1 && arg.Substring(0, 2).ToUpper() == "-S")
+                    if (arg.StartsWith("-S", StringComparison.OrdinalIgnoreCase))
                         myargs.Server = arg.Substring(2);
                 }
                 if (myargs.Server == "") myargs.Server = arguments[arguments.Count - 1];
@@ -1068,7 +1226,7 @@ namespace ibsCompiler
         {
             for (int i = 0; i < arguments.Count; i++)
             {
-                if (arguments[i].Length > 1 && arguments[i].Substring(0, 2).ToUpper() == flag.ToUpper())
+                if (arguments[i].StartsWith(flag, StringComparison.OrdinalIgnoreCase))
                 {
                     var value = arguments[i].Substring(2);
                     arguments.RemoveAt(i);
@@ -1088,7 +1246,7 @@ namespace ibsCompiler
         {
             for (int i = 0; i < arguments.Count; i++)
             {
-                if (arguments[i].Length > 1 && arguments[i].Substring(0, 2).ToUpper() == flag.ToUpper())
+                if (arguments[i].StartsWith(flag, StringComparison.OrdinalIgnoreCase))
                 {
                     arguments.RemoveAt(i);
                     return true;
@@ -1101,7 +1259,7 @@ namespace ibsCompiler
         {
             for (int i = 0; i < arguments.Count; i++)
             {
-                if (arguments[i].Length > 1 && arguments[i].Substring(0, 2).ToUpper() == flag.ToUpper())
+                if (arguments[i].StartsWith(flag, StringComparison.OrdinalIgnoreCase))
                 {
                     var str = arguments[i].Substring(2).Trim();
                     arguments.RemoveAt(i);
@@ -1119,14 +1277,18 @@ namespace ibsCompiler
 
         private static bool FindAndRemove_BoolFlag(string flag, ref List<string> arguments, bool defaultValue)
         {
-            var rx = new Regex(@"^" + Regex.Escape(flag) + @"(:[yn])?$", RegexOptions.IgnoreCase);
+            // Matches flag, flag:y or flag:n (case-insensitive). Plain string compares rather
+            // than a per-call Regex: this runs on every CLI startup.
             for (int i = 0; i < arguments.Count; i++)
             {
-                var m = rx.Match(arguments[i]);
-                if (m.Success)
+                var arg = arguments[i];
+                if (!arg.StartsWith(flag, StringComparison.OrdinalIgnoreCase)) continue;
+                var suffix = arg.AsSpan(flag.Length);
+                bool isNo = suffix.Equals(":n", StringComparison.OrdinalIgnoreCase);
+                if (suffix.Length == 0 || isNo || suffix.Equals(":y", StringComparison.OrdinalIgnoreCase))
                 {
                     arguments.RemoveAt(i);
-                    return m.Groups[1].Value.ToLower() != ":n";
+                    return !isNo;
                 }
             }
             return defaultValue;
@@ -1203,18 +1365,20 @@ namespace ibsCompiler
         public static List<string> GenerateCompileOptionFile(string sourceFile)
         {
             var dest = new List<string>();
-            using var source = new StreamReader(sourceFile);
+            using var source = new StreamReader(sourceFile, System.Text.Encoding.UTF8, true, DataFileBufferSize);
             string? line;
             while ((line = source.ReadLine()) != null)
             {
                 if (line.Length > 1)
                 {
-                    switch (line.Substring(0, 2))
+                    switch (line.AsSpan(0, 2))
                     {
                         case "v:":
                         {
                             var opt_name = "&" + line.Substring(2, line.IndexOf(' ') - 1).Trim() + "&";
-                            var opt_value = line.Substring(line.IndexOf("<<") + 2, line.IndexOf(">>") - line.IndexOf("<<") - 2).Trim();
+                            int open = line.IndexOf("<<", StringComparison.Ordinal);
+                            int close = line.IndexOf(">>", StringComparison.Ordinal);
+                            var opt_value = line.Substring(open + 2, close - open - 2).Trim();
                             dest.Add(opt_name.PadRight(40) + opt_value.PadRight(200));
                             break;
                         }
@@ -1231,10 +1395,10 @@ namespace ibsCompiler
                             {
                                 if_ = "/*"; endif_ = "*/"; ifn_ = ""; endifn_ = "";
                             }
-                            dest.Add(("&if_" + opt_name.Trim() + "&").PadRight(40) + if_.PadRight(200));
-                            dest.Add(("&endif_" + opt_name.Trim() + "&").PadRight(40) + endif_.PadRight(200));
-                            dest.Add(("&ifn_" + opt_name.Trim() + "&").PadRight(40) + ifn_.PadRight(200));
-                            dest.Add(("&endifn_" + opt_name.Trim() + "&").PadRight(40) + endifn_.PadRight(200));
+                            dest.Add(("&if_" + opt_name + "&").PadRight(40) + if_.PadRight(200));
+                            dest.Add(("&endif_" + opt_name + "&").PadRight(40) + endif_.PadRight(200));
+                            dest.Add(("&ifn_" + opt_name + "&").PadRight(40) + ifn_.PadRight(200));
+                            dest.Add(("&endifn_" + opt_name + "&").PadRight(40) + endifn_.PadRight(200));
                             break;
                         }
                     }
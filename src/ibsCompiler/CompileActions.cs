@@ -61,7 +61,9 @@ namespace ibsCompiler
                         if (line.Trim().Substring(0, 2) == ":>")
                         {
                             i++;
-                            dest.WriteLine(i + "\t" + line);
+                            dest.Write(i);
+                            dest.Write('\t');
+                            dest.WriteLine(line);
                         }
                     }
                 }
@@ -79,8 +81,20 @@ namespace ibsCompiler
                         line = myOptions.ReplaceOptions(line);
                         if (line.Trim().Substring(0, 2) == ":>")
                         {
-                            var t = line.Trim();
-                            dest.WriteLine(t.Substring(2, 4) + "\t" + t.Substring(7, 3) + "\t" + t.Substring(11, 3) + "\t" + t.Substring(15, 5) + "\t" + t.Substring(21, 3) + "\t" + t.Substring(24));
+                            // Fixed-width columns go to the writer as slices of the line,
+                            // not as six substrings plus a concatenated row.
+                            var t = line.Trim().AsSpan();
+                            dest.Write(t.Slice(2, 4));
+                            dest.Write('\t');
+                            dest.Write(t.Slice(7, 3));
+                            dest.Write('\t');
+                            dest.Write(t.Slice(11, 3));
+                            dest.Write('\t');
+                            dest.Write(t.Slice(15, 5));
+                            dest.Write('\t');
+                            dest.Write(t.Slice(21, 3));
+                            dest.Write('\t');
+                            dest.WriteLine(t.Slice(24));
                         }
                     }
                 }
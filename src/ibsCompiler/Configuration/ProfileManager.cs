@@ -1,3 +1,4 @@
+using System.Text.Encodings.Web;
 using System.Text.Json;
 
 namespace ibsCompiler.Configuration
@@ -12,6 +13,23 @@ namespace ibsCompiler.Configuration
         private SettingsFile _settings;
         private string? _settingsPath;
 
+        // Shared across loads: each JsonSerializerOptions instance builds its own
+        // reflection metadata cache on first use, which dominates a short CLI run.
+        private static readonly JsonSerializerOptions ReadOptions = new() { PropertyNameCaseInsensitive = true };
+
+        /// <summary>
+        /// Options for every settings.json write (profiles and data_transfer projects alike).
+        /// Relaxed escaping writes &amp;, +, &lt;, ' and non-ASCII text literally where the
+        /// default encoder writes \uXXXX escapes. Both read back to the same strings; this
+        /// only changes the on-disk format, trading strict escaping for a cheaper, more
+        /// readable file. Indentation matches what users hand-edit.
+        /// </summary>
+        public static readonly JsonSerializerOptions SettingsWriteOptions = new()
+        {
+            WriteIndented = true,
+            Encoder = JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+        };
+
         public ProfileManager()
         {
             _settings = new SettingsFile();
@@ -36,8 +54,7 @@ namespace ibsCompiler.Configuration
                 // replacing settings.json; never read it half-written (SR 52910).
                 var json = ibs_compiler_common.ReadAllTextResilient(path);
                 if (json == null) { _settings = new SettingsFile(); return; }
-                var options = new JsonSerializerOptions { PropertyNameCaseInsensitive = true };
-                _settings = JsonSerializer.Deserialize<SettingsFile>(json, options) ?? new SettingsFile();
+                _settings = JsonSerializer.Deserialize<SettingsFile>(json, ReadOptions) ?? new SettingsFile();
                 CleanupSettings();
             }
             catch
@@ -81,8 +98,7 @@ namespace ibsCompiler.Configuration
 
                 if (changed)
                 {
-                    var writeOptions = new JsonSerializerOptions { WriteIndented = true };
-                    var json = JsonSerializer.Serialize(_settings, writeOptions);
+                    var json = JsonSerializer.Serialize(_settings, SettingsWriteOptions);
                     ibs_compiler_common.WriteAllTextAtomic(_settingsPath, json);
                 }
             }
@@ -117,35 +133,41 @@ namespace ibsCompiler.Configuration
             return null;
         }
 
-        /// <summary>
-        /// Resolve a server name or alias to a profile. Returns null if no profile found.
-        /// </summary>
-        public (string ProfileName, ProfileData Profile)? ResolveProfile(string nameOrAlias)
-        {
-            if (string.IsNullOrEmpty(nameOrAlias) || _settings.Profiles.Count == 0)
-                return null;
-
-            var upper = nameOrAlias.ToUpperInvariant();
-
-            // Exact name match (case-insensitive)
-            foreach (var kvp in _settings.Profiles)
-            {
-                if (kvp.Key.ToUpperInvariant() == upper)
-                    return (kvp.Key, kvp.Value);
-            }
+        // Name-or-alias (any case) -> profile key, built on first lookup. Names are added
+        // before aliases and the first entry wins, matching the old name-then-alias scans.
+        private Dictionary<string, string>? _profileIndex;
 
-            // Alias match (case-insensitive)
-            foreach (var kvp in _settings.Profiles)
+        private Dictionary<string, string> ProfileIndex
+        {
+            get
             {
-                if (kvp.Value.Aliases != null)
+                if (_profileIndex != null) return _profileIndex;
+                var index = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+                foreach (var name in _settings.Profiles.Keys)
+                    index.TryAdd(name, name);
+                foreach (var kvp in _settings.Profiles)
                 {
+                    if (kvp.Value.Aliases == null) continue;
                     foreach (var alias in kvp.Value.Aliases)
                     {
-                        if (alias.ToUpperInvariant() == upper)
-                            return (kvp.Key, kvp.Value);
+                        if (alias != null)
+                            index.TryAdd(alias, kvp.Key);
                     }
                 }
+                return _profileIndex = index;
             }
+        }
+
+        /// <summary>
+        /// Resolve a server name or alias to a profile. Returns null if no profile found.
+        /// </summary>
+        public (string ProfileName, ProfileData Profile)? ResolveProfile(string nameOrAlias)
+        {
+            if (string.IsNullOrEmpty(nameOrAlias) || _settings.Profiles.Count == 0)
+                return null;
+
+            if (ProfileIndex.TryGetValue(nameOrAlias, out var key))
+                return (key, _settings.Profiles[key]);
 
             return null;
         }
@@ -232,10 +254,10 @@ namespace ibsCompiler.Configuration
             };
         }
 
-        public List<string> ListProfiles()
-        {
-            return _settings.Profiles.Keys.ToList();
-        }
+        /// <summary>
+        /// Profile names as a live read-only view of the loaded settings (no copy per call).
+        /// </summary>
+        public IReadOnlyCollection<string> ListProfiles() => _settings.Profiles.Keys;
 
         /// <summary>
         /// Returns false (and prints an error) if profiles are configured but <paramref name="nameOrAlias"/> doesn't match any of them.
@@ -36,6 +36,7 @@ namespace ibsCompiler.Database
         /// <summary>
         /// Bulk copy data between a file and a database table.
         /// Replaces F4.8's exec_bcp() which launched native bcp/obcp.
+        /// On success Output holds the number of rows copied, in either direction.
         /// </summary>
         ExecReturn BulkCopy(string table, BcpDirection direction, string dataFile, string formatFile = "");
     }
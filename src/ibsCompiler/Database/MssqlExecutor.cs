@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Data;
 using System.Text;
 using System.Text.RegularExpressions;
@@ -13,6 +14,15 @@ namespace ibsCompiler.Database
         private static readonly Regex ExitRegex = new(@"^\s*(exit|quit)\s*$", RegexOptions.IgnoreCase);
         private static readonly string? SqlCmdInitScript = LoadSqlCmdInit();
 
+        // Database-level QUOTED_IDENTIFIER per "server|database", so the sys.databases probe runs
+        // once per database instead of on every connection. Cleared whenever a batch changes a
+        // database's setting (ALTER DATABASE ... SET QUOTED_IDENTIFIER, sp_dboption) so the
+        // database stays the source of truth.
+        private static readonly ConcurrentDictionary<string, bool> DatabaseQuotedIdentifier =
+            new(StringComparer.OrdinalIgnoreCase);
+        private static readonly Regex AlterQuotedIdentifierRegex = new(
+            @"\b(alter\s+database|sp_dboption)\b", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
         // Per-call output sink wired up by ExecuteSql/ExecuteBatch. The persistent
         // connection's InfoMessage handler routes through this so PRINT/RAISERROR
         // messages stream as the server emits them.
@@ -69,32 +79,69 @@ namespace ibsCompiler.Database
             // Session defaults (ARITHABORT, CONCAT_NULL_YIELDS_NULL, ANSI_NULL_DFLT, ...) come from
             // SQLCMDINI.sql via the env var / local file — never hard-coded. Same mechanism native
             // sqlcmd and the legacy compiler used.
-            if (SqlCmdInitScript != null)
-                using (var cmd = new SqlCommand(SqlCmdInitScript, connection))
-                    cmd.ExecuteNonQuery();
+            //
             // Honor the target database's QUOTED_IDENTIFIER. Microsoft.Data.SqlClient forces it ON at
             // login regardless of the database default (this is the one option where it differs from
             // native sqlcmd, whose default is OFF). Read the database's configured value and SET the
             // session to match, so the database — configured by the installer — is the source of
             // truth. SBN needs OFF, which install-sbn sets at the model/database level.
-            ApplyDatabaseQuotedIdentifier(connection);
-        }
+            //
+            // The init script rides in the same batch as the probe (first connection to a database)
+            // or the SET (every later one), so session setup is one round-trip once cached.
+            var key = connection.DataSource + "|" + connection.Database;
+            if (DatabaseQuotedIdentifier.TryGetValue(key, out var cached))
+            {
+                RunInitBatch(connection, SetQuotedIdentifier(cached));
+                return;
+            }
 
-        private static void ApplyDatabaseQuotedIdentifier(SqlConnection connection)
-        {
             bool? on = null;
             using (var q = new SqlCommand(
+                (SqlCmdInitScript != null ? SqlCmdInitScript + "\n" : "") +
                 "SELECT is_quoted_identifier_on FROM sys.databases WHERE database_id = DB_ID()", connection))
+            using (var reader = q.ExecuteReader())
             {
-                var o = q.ExecuteScalar();
-                if (o != null && o != DBNull.Value) on = Convert.ToBoolean(o);
+                // The probe is the batch's last result set.
+                do
+                {
+                    if (reader.FieldCount > 0 && reader.Read())
+                        on = reader.IsDBNull(0) ? null : Convert.ToBoolean(reader.GetValue(0));
+                } while (reader.NextResult());
             }
             if (on.HasValue)
-                using (var s = new SqlCommand("SET QUOTED_IDENTIFIER " + (on.Value ? "ON" : "OFF"), connection))
-                    s.ExecuteNonQuery();
+            {
+                DatabaseQuotedIdentifier[key] = on.Value;
+                using var s = new SqlCommand(SetQuotedIdentifier(on.Value), connection);
+                s.ExecuteNonQuery();
+            }
+        }
+
+        private static string SetQuotedIdentifier(bool on) => "SET QUOTED_IDENTIFIER " + (on ? "ON" : "OFF");
+
+        private static void RunInitBatch(SqlConnection connection, string setQuotedIdentifier)
+        {
+            var sql = SqlCmdInitScript != null ? SqlCmdInitScript + "\n" + setQuotedIdentifier : setQuotedIdentifier;
+            using var cmd = new SqlCommand(sql, connection);
+            cmd.ExecuteNonQuery();
+        }
+
+        private static void InvalidateQuotedIdentifierCache(string batch)
+        {
+            // Session-level SET QUOTED_IDENTIFIER (common in proc scripts) doesn't change the
+            // database default; only ALTER DATABASE / sp_dboption do.
+            if (batch.Contains("QUOTED_IDENTIFIER", StringComparison.OrdinalIgnoreCase) &&
+                AlterQuotedIdentifierRegex.IsMatch(batch))
+                DatabaseQuotedIdentifier.Clear();
         }
 
-        private string BuildConnectionString(string database)
+        // Connection strings per database. A compile run opens a connection per script against
+        // the same handful of databases; build each string once per executor.
+        private readonly ConcurrentDictionary<string, string> _connectionStrings = new();
+
+        private string BuildConnectionString(string database) =>
+            _connectionStrings.GetOrAdd(database, ComposeConnectionString);
+
+        private string ComposeConnectionString(string database)
         {
             var sb = new SqlConnectionStringBuilder
             {
@@ -130,6 +177,7 @@ namespace ibsCompiler.Database
                 {
                     if (string.IsNullOrWhiteSpace(batch)) continue;
                     if (ExitRegex.IsMatch(batch.Trim())) break;
+                    InvalidateQuotedIdentifierCache(batch);
                     try
                     {
                         using var cmd = new SqlCommand(batch, connection);
@@ -179,6 +227,7 @@ namespace ibsCompiler.Database
             {
                 if (!string.IsNullOrWhiteSpace(batch))
                 {
+                    InvalidateQuotedIdentifierCache(batch);
                     using var cmd = new SqlCommand(batch, _persistentConn);
                     cmd.CommandTimeout = 0;
 
@@ -242,7 +291,8 @@ namespace ibsCompiler.Database
             {
                 if (direction == BcpDirection.IN)
                 {
-                    BulkCopyIn(table, dataFile, formatFile);
+                    var rows = BulkCopyIn(table, dataFile, formatFile);
+                    result.Output = rows.ToString();
                 }
                 else
                 {
@@ -260,7 +310,11 @@ namespace ibsCompiler.Database
             return result;
         }
 
-        private void BulkCopyIn(string table, string dataFile, string formatFile)
+        // Rows buffered per WriteToServer call in BulkCopyIn. The server already commits every
+        // BatchSize rows, so chunking the client side changes memory use, not atomicity.
+        private const int FlushRows = 50_000;
+
+        private int BulkCopyIn(string table, string dataFile, string formatFile)
         {
             // Parse database from table name (e.g., "sbnmaster..w#actions" → db=sbnmaster, table=w#actions)
             string database = "";
@@ -302,18 +356,21 @@ namespace ibsCompiler.Database
                 NotifyAfter = 1000
             };
 
+            // RowsCopied restarts with every WriteToServer call; add what earlier chunks sent.
+            long flushed = 0;
             bulkCopy.SqlRowsCopied += (sender, e) =>
             {
-                ibs_compiler_common.WriteLine($"{e.RowsCopied} rows sent to the server.");
+                ibs_compiler_common.WriteLine($"{flushed + e.RowsCopied} rows sent to the server.");
             };
 
-            // Read tab-delimited data file and load into table
-            var lines = File.ReadAllLines(dataFile);
-            if (lines.Length == 0) return;
+            // Stream the data file a line at a time and hand the server FlushRows rows per
+            // WriteToServer, so memory holds one chunk rather than the whole file.
+            using var lines = File.ReadLines(dataFile).GetEnumerator();
+            if (!lines.MoveNext()) return 0;
 
             // Build DataTable with correct column types from schema
             var dataTable = new DataTable();
-            var firstCols = lines[0].Split('\t');
+            var firstCols = lines.Current.Split('\t');
             int colCount = firstCols.Length;
             for (int i = 0; i < colCount; i++)
             {
@@ -326,8 +383,20 @@ namespace ibsCompiler.Database
             for (int i = 0; i < colCount; i++)
                 bulkCopy.ColumnMappings.Add(i, i);
 
-            foreach (var line in lines)
+            // Resolve each column's conversion once, not per cell.
+            var numericTypes = new Type?[colCount];
+            for (int i = 0; i < colCount; i++)
             {
+                var t = dataTable.Columns[i].DataType;
+                if (t == typeof(int) || t == typeof(long) || t == typeof(short) || t == typeof(byte) ||
+                    t == typeof(decimal) || t == typeof(double) || t == typeof(float))
+                    numericTypes[i] = t;
+            }
+
+            int total = 0;
+            do
+            {
+                var line = lines.Current;
                 if (string.IsNullOrEmpty(line)) continue;
                 var cols = line.Split('\t');
 
@@ -346,13 +415,9 @@ namespace ibsCompiler.Database
                 for (int i = 0; i < Math.Min(cols.Length, dataTable.Columns.Count); i++)
                 {
                     var val = cols[i];
-                    var colType = dataTable.Columns[i].DataType;
-                    bool isNumeric = colType == typeof(int) || colType == typeof(long) ||
-                                     colType == typeof(short) || colType == typeof(byte) ||
-                                     colType == typeof(decimal) || colType == typeof(double) ||
-                                     colType == typeof(float);
+                    var colType = numericTypes[i];
 
-                    if (isNumeric)
+                    if (colType != null)
                     {
                         if (string.IsNullOrEmpty(val))
                             row[i] = Convert.ChangeType(0, colType);
@@ -365,12 +430,22 @@ namespace ibsCompiler.Database
                     }
                 }
                 dataTable.Rows.Add(row);
-            }
+                total++;
 
-            bulkCopy.WriteToServer(dataTable);
+                if (dataTable.Rows.Count == FlushRows)
+                {
+                    bulkCopy.WriteToServer(dataTable);
+                    flushed += dataTable.Rows.Count;
+                    dataTable.Clear();
+                }
+            } while (lines.MoveNext());
+
+            if (dataTable.Rows.Count > 0)
+                bulkCopy.WriteToServer(dataTable);
 
             ibs_compiler_common.WriteLine("");
-            ibs_compiler_common.WriteLine($"{dataTable.Rows.Count} rows copied.");
+            ibs_compiler_common.WriteLine($"{total} rows copied.");
+            return total;
         }
 
         private int BulkCopyOut(string table, string dataFile)
@@ -391,15 +466,19 @@ namespace ibsCompiler.Database
 
             using var cmd = new SqlCommand($"SELECT * FROM {tableName}", connection);
             using var reader = cmd.ExecuteReader();
-            using var writer = ibs_compiler_common.OpenSourceWriter(dataFile);
+            using var writer = ibs_compiler_common.OpenSourceWriter(dataFile, bufferSize: ibs_compiler_common.DataFileBufferSize);
 
+            // Fields go straight to the writer — no per-row array or joined string.
+            int fieldCount = reader.FieldCount;
             int rowCount = 0;
             while (reader.Read())
             {
-                var values = new string[reader.FieldCount];
-                for (int i = 0; i < reader.FieldCount; i++)
-                    values[i] = reader.IsDBNull(i) ? "" : reader[i].ToString() ?? "";
-                writer.WriteLine(string.Join("\t", values));
+                for (int i = 0; i < fieldCount; i++)
+                {
+                    if (i > 0) writer.Write('\t');
+                    writer.Write(reader.IsDBNull(i) ? "" : reader[i].ToString() ?? "");
+                }
+                writer.WriteLine();
                 rowCount++;
                 if (rowCount % 1000 == 0)
                     ibs_compiler_common.WriteLine($"{rowCount} rows successfully extracted to {dataFile}");
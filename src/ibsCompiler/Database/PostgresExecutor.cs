@@ -1,3 +1,5 @@
+using System.Buffers;
+using System.Collections.Concurrent;
 using System.Text;
 using System.Text.RegularExpressions;
 using Npgsql;
@@ -110,19 +112,22 @@ namespace ibsCompiler.Database
             return (_profile.AdminDatabase, database);
         }
 
+        // Connection strings per database, built once per executor (see MssqlExecutor).
+        private readonly ConcurrentDictionary<string, string> _connectionStrings = new();
+
         private NpgsqlConnection NewConnection(string database)
         {
-            var sb = new NpgsqlConnectionStringBuilder
+            var connStr = _connectionStrings.GetOrAdd(database, db => new NpgsqlConnectionStringBuilder
             {
                 Host = _profile.Host,
                 Port = _profile.Port,
                 Username = _profile.User,
                 Password = _profile.Pass,
-                Database = database,
+                Database = db,
                 Pooling = false,
                 ApplicationName = "ibsCompiler"
-            };
-            var conn = new NpgsqlConnection(sb.ConnectionString);
+            }.ConnectionString);
+            var conn = new NpgsqlConnection(connStr);
             conn.Notice += OnNotice;
             return conn;
         }
@@ -330,7 +335,8 @@ namespace ibsCompiler.Database
             {
                 if (direction == BcpDirection.IN)
                 {
-                    BulkCopyIn(table, dataFile);
+                    var rows = BulkCopyIn(table, dataFile);
+                    result.Output = rows.ToString();
                 }
                 else
                 {
@@ -384,7 +390,7 @@ namespace ibsCompiler.Database
             return needs ? "\"" + ident.Replace("\"", "\"\"") + "\"" : ident;
         }
 
-        private void BulkCopyIn(string table, string dataFile)
+        private int BulkCopyIn(string table, string dataFile)
         {
             using var conn = OpenBulkConnection();
             var target = ResolveCopyTarget(table);
@@ -398,16 +404,25 @@ namespace ibsCompiler.Database
                     columnTypes.Add(schemaReader.GetFieldType(i));
             }
 
-            var lines = File.ReadAllLines(dataFile);
-            if (lines.Length == 0) return;
-            int colCount = columnTypes.Count > 0 ? columnTypes.Count : lines[0].Split('\t').Length;
+            // Stream the file a line at a time — rows go straight from disk into COPY, so
+            // memory stays flat however large the data file is.
+            using var lines = File.ReadLines(dataFile).GetEnumerator();
+            if (!lines.MoveNext()) return 0;
+            int colCount = columnTypes.Count > 0 ? columnTypes.Count : lines.Current.Split('\t').Length;
+
+            // Classify each column once rather than re-testing its type on every cell.
+            var isNumeric = new bool[colCount];
+            for (int i = 0; i < colCount && i < columnTypes.Count; i++)
+                isNumeric[i] = IsNumericType(columnTypes[i]);
 
             int total = 0;
+            var sb = new StringBuilder(); // reused across rows
             // Text-format COPY: write tab-separated, PG-escaped rows straight to STDIN.
             using (var writer = conn.BeginTextImport($"COPY {target} FROM STDIN (FORMAT text)"))
             {
-                foreach (var line in lines)
+                do
                 {
+                    var line = lines.Current;
                     if (string.IsNullOrEmpty(line)) continue;
                     var cols = line.Split('\t');
 
@@ -421,13 +436,12 @@ namespace ibsCompiler.Database
                         cols = merged;
                     }
 
-                    var sb = new StringBuilder();
+                    sb.Clear();
                     for (int i = 0; i < colCount; i++)
                     {
                         if (i > 0) sb.Append('\t');
                         string val = i < cols.Length ? cols[i] : "";
-                        bool isNum = i < columnTypes.Count && IsNumericType(columnTypes[i]);
-                        if (isNum && string.IsNullOrEmpty(val)) val = "0"; // empty numeric → 0
+                        if (isNumeric[i] && string.IsNullOrEmpty(val)) val = "0"; // empty numeric → 0
                         // empty string stays empty (not NULL) for text columns
                         sb.Append(EscapeCopyText(val));
                     }
@@ -439,11 +453,12 @@ namespace ibsCompiler.Database
                     total++;
                     if (total % 1000 == 0)
                         ibs_compiler_common.WriteLine($"{total} rows sent to the server.");
-                }
+                } while (lines.MoveNext());
             } // dispose completes the COPY
 
             ibs_compiler_common.WriteLine("");
             ibs_compiler_common.WriteLine($"{total} rows copied.");
+            return total;
         }
 
         private int BulkCopyOut(string table, string dataFile)
@@ -452,7 +467,7 @@ namespace ibsCompiler.Database
             var target = ResolveCopyTarget(table);
 
             using var reader = conn.BeginTextExport($"COPY (SELECT * FROM {target}) TO STDOUT (FORMAT text)");
-            using var writer = ibs_compiler_common.OpenSourceWriter(dataFile);
+            using var writer = ibs_compiler_common.OpenSourceWriter(dataFile, bufferSize: ibs_compiler_common.DataFileBufferSize);
 
             int rowCount = 0;
             string? line;
@@ -468,10 +483,14 @@ namespace ibsCompiler.Database
             return rowCount;
         }
 
+        private static readonly SearchValues<char> CopyTextSpecials = SearchValues.Create("\\\t\n\r");
+
         // PG text-format field escaping: backslash, tab, newline, CR.
         private static string EscapeCopyText(string s)
         {
-            var sb = new StringBuilder(s.Length);
+            // Most fields need no escaping; one vectorized scan avoids rebuilding them.
+            if (s.AsSpan().IndexOfAny(CopyTextSpecials) < 0) return s;
+            var sb = new StringBuilder(s.Length + 8);
             foreach (char c in s)
             {
                 switch (c)
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Data;
 using System.Text;
@@ -161,7 +162,13 @@ namespace ibsCompiler.Database
         // cp850) because the server rejects the mismatch outright. Letting the server decide
         // is the only universal approach — it works for utf8, cp850, iso_1, and any other
         // charset the server is configured with.
-        private string BuildConnectionString(string database)
+        // Connection strings per database, built once per executor (see MssqlExecutor).
+        private readonly ConcurrentDictionary<string, string> _connectionStrings = new();
+
+        private string BuildConnectionString(string database) =>
+            _connectionStrings.GetOrAdd(database, ComposeConnectionString);
+
+        private string ComposeConnectionString(string database)
         {
             var sb = new StringBuilder();
             sb.Append($"Data Source={_profile.Host}");
@@ -374,7 +381,8 @@ namespace ibsCompiler.Database
             {
                 if (direction == BcpDirection.IN)
                 {
-                    BulkCopyIn(table, dataFile);
+                    var rows = BulkCopyIn(table, dataFile);
+                    result.Output = rows.ToString();
                 }
                 else
                 {
@@ -392,7 +400,7 @@ namespace ibsCompiler.Database
             return result;
         }
 
-        private void BulkCopyIn(string table, string dataFile)
+        private int BulkCopyIn(string table, string dataFile)
         {
             string database = "";
             string tableName = table;
@@ -420,18 +428,21 @@ namespace ibsCompiler.Database
             };
 
             // Read tab-delimited data file and load into DataTable (all string columns)
-            // Server handles type conversion during BCP insert
-            var lines = File.ReadAllLines(dataFile);
-            if (lines.Length == 0) return;
+            // Server handles type conversion during BCP insert. The file is streamed rather than
+            // read whole; the rows still go up in one WriteToServer because BatchSize = 0 makes
+            // the load a single batch, and splitting it would change what a failure rolls back.
+            using var lines = File.ReadLines(dataFile).GetEnumerator();
+            if (!lines.MoveNext()) return 0;
 
             var dataTable = new DataTable();
-            var firstCols = lines[0].Split('\t');
+            var firstCols = lines.Current.Split('\t');
             int colCount = firstCols.Length;
             for (int i = 0; i < colCount; i++)
                 dataTable.Columns.Add($"col{i}", typeof(string));
 
-            foreach (var line in lines)
+            do
             {
+                var line = lines.Current;
                 if (string.IsNullOrEmpty(line)) continue;
                 var cols = line.Split('\t');
 
@@ -449,12 +460,13 @@ namespace ibsCompiler.Database
                 for (int i = 0; i < Math.Min(cols.Length, colCount); i++)
                     row[i] = ToServer(cols[i]);
                 dataTable.Rows.Add(row);
-            }
+            } while (lines.MoveNext());
 
             bulkCopy.WriteToServer(dataTable);
 
             ibs_compiler_common.WriteLine("");
             ibs_compiler_common.WriteLine($"{dataTable.Rows.Count} rows copied.");
+            return dataTable.Rows.Count;
         }
 
         private int BulkCopyOut(string table, string dataFile)
@@ -474,15 +486,19 @@ namespace ibsCompiler.Database
 
             using var cmd = new AseCommand($"SELECT * FROM {tableName}", connection);
             using var reader = cmd.ExecuteReader();
-            using var writer = ibs_compiler_common.OpenSourceWriter(dataFile);
+            using var writer = ibs_compiler_common.OpenSourceWriter(dataFile, bufferSize: ibs_compiler_common.DataFileBufferSize);
 
+            // Fields go straight to the writer — no per-row array or joined string.
+            int fieldCount = reader.FieldCount;
             int rowCount = 0;
             while (reader.Read())
             {
-                var values = new string[reader.FieldCount];
-                for (int i = 0; i < reader.FieldCount; i++)
-                    values[i] = FromServer(reader.IsDBNull(i) ? "" : reader[i].ToString() ?? "");
-                writer.WriteLine(string.Join("\t", values));
+                for (int i = 0; i < fieldCount; i++)
+                {
+                    if (i > 0) writer.Write('\t');
+                    writer.Write(FromServer(reader.IsDBNull(i) ? "" : reader[i].ToString() ?? ""));
+                }
+                writer.WriteLine();
                 rowCount++;
                 if (rowCount % 1000 == 0)
                     ibs_compiler_common.WriteLine($"{rowCount} rows successfully extracted to {dataFile}");
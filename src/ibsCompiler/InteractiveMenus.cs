@@ -38,12 +38,12 @@ namespace ibsCompiler
             while (true)
             {
                 Console.Write($"{prompt} ({hint}): ");
-                var response = Console.ReadLine()?.Trim().ToLower() ?? "";
-                if (response == "")
+                var response = Console.ReadLine().AsSpan().Trim();
+                if (response.IsEmpty)
                     return defaultYes;
-                if (response == "y" || response == "yes")
+                if (response.Equals("y", StringComparison.OrdinalIgnoreCase) || response.Equals("yes", StringComparison.OrdinalIgnoreCase))
                     return true;
-                if (response == "n" || response == "no")
+                if (response.Equals("n", StringComparison.OrdinalIgnoreCase) || response.Equals("no", StringComparison.OrdinalIgnoreCase))
                     return false;
                 Console.WriteLine("Please answer 'y' or 'n'.");
             }
@@ -56,50 +56,10 @@ namespace ibsCompiler
         /// </summary>
         public static void LaunchEditor(string filePath)
         {
-            string? editor = null;
-
-            // 1. $EDITOR
-            var envEditor = Environment.GetEnvironmentVariable("EDITOR")?.Trim();
-            if (!string.IsNullOrEmpty(envEditor))
-                editor = envEditor;
-
-            // 2. $VISUAL
-            if (editor == null)
-            {
-                var envVisual = Environment.GetEnvironmentVariable("VISUAL")?.Trim();
-                if (!string.IsNullOrEmpty(envVisual))
-                    editor = envVisual;
-            }
-
-            // 3. Try vim, vi
-            if (editor == null)
-            {
-                foreach (var candidate in new[] { "vim", "vi" })
-                {
-                    try
-                    {
-                        var p = Process.Start(new ProcessStartInfo
-                        {
-                            FileName = RuntimeInformation.IsOSPlatform(OSPlatform.Windows) ? "where" : "which",
-                            Arguments = candidate,
-                            RedirectStandardOutput = true,
-                            UseShellExecute = false,
-                            CreateNoWindow = true
-                        });
-                        p?.WaitForExit();
-                        if (p?.ExitCode == 0)
-                        {
-                            editor = candidate;
-                            break;
-                        }
-                    }
-                    catch { }
-                }
-            }
-
-            // 4. Windows fallback: notepad
-            if (editor == null && RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
-                editor = "notepad";
+            var editor = ResolveEditor(
+                Environment.GetEnvironmentVariable("EDITOR"),
+                Environment.GetEnvironmentVariable("VISUAL"),
+                Environment.GetEnvironmentVariable("PATH"));
 
             if (editor == null)
             {
@@ -122,6 +82,61 @@ namespace ibsCompiler
             }
         }
 
+        /// <summary>
+        /// Picks the editor command for the given $EDITOR, $VISUAL and PATH values, in one
+        /// pass over the fallback chain.
+        /// </summary>
+        private static string? ResolveEditor(string? envEditor, string? envVisual, string? pathVar)
+        {
+            if (!string.IsNullOrWhiteSpace(envEditor))
+                return envEditor.Trim();
+            if (!string.IsNullOrWhiteSpace(envVisual))
+                return envVisual.Trim();
+            if (FindOnPath("vim", pathVar ?? "") != null)
+                return "vim";
+            if (FindOnPath("vi", pathVar ?? "") != null)
+                return "vi";
+            if (RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
+                return "notepad";
+            return null;
+        }
+
+        private static readonly Dictionary<(string Name, string Path), string?> _pathLookups = new();
+
+        /// <summary>
+        /// Resolves an executable name against the given PATH value (and PATHEXT on Windows)
+        /// in-process, the way which/where would. Results are cached per name and PATH value.
+        /// </summary>
+        private static string? FindOnPath(string name, string pathVar)
+        {
+            var key = (name, pathVar);
+            if (_pathLookups.TryGetValue(key, out var cached))
+                return cached;
+
+            string? found = null;
+            var isWindows = RuntimeInformation.IsOSPlatform(OSPlatform.Windows);
+            var extensions = isWindows
+                ? (Environment.GetEnvironmentVariable("PATHEXT") ?? ".EXE;.CMD;.BAT;.COM").Split(';', StringSplitOptions.RemoveEmptyEntries)
+                : new[] { "" };
+            foreach (var dir in pathVar.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
+            {
+                foreach (var ext in extensions)
+                {
+                    var candidate = Path.Combine(dir.Trim('"'), name + ext);
+                    if (File.Exists(candidate) && (isWindows
+                        || (File.GetUnixFileMode(candidate) & (UnixFileMode.UserExecute | UnixFileMode.GroupExecute | UnixFileMode.OtherExecute)) != 0))
+                    {
+                        found = candidate;
+                        break;
+                    }
+                }
+                if (found != null) break;
+            }
+
+            _pathLookups[key] = found;
+            return found;
+        }
+
         /// <summary>
         /// Flag names that force a rebuild of the resolved options cache. Accepted by
         /// set_options / eopt and set_table_locations / eloc.
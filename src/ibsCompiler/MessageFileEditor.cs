@@ -496,7 +496,9 @@ namespace ibsCompiler
         public static List<MsgRow> FindMessages(MsgFile file, string type, string term, int? cmpy = null, int? lang = null)
         {
             term ??= "";
-            var pattern = term.Length == 0 ? null : BuildTermPattern(term);
+            // A term of only '*' (the "show everything" search) matches every row just like
+            // an empty one — skip the regex instead of running ^.*$ over each msgno and text.
+            var pattern = term.AsSpan().Trim('*').IsEmpty ? null : BuildTermPattern(term);
             var results = new List<MsgRow>();
             foreach (var row in file.Rows)
             {
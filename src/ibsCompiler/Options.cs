@@ -38,9 +38,10 @@ namespace ibsCompiler
         public void ReportResolvedOptionsPath()
         {
             var path = ResolvedOptionsPath;
-            if (File.Exists(path))
+            var fi = new FileInfo(path);
+            if (fi.Exists)
             {
-                var age = (int)DateTime.Now.Subtract(new FileInfo(path).CreationTime).TotalMinutes;
+                var age = (int)DateTime.Now.Subtract(fi.CreationTime).TotalMinutes;
                 ibs_compiler_common.WriteLine($"resolved options file: {path} ({age} min old, rebuilt after 60)", _cmdvars.OutFile);
             }
             else
@@ -64,17 +65,11 @@ namespace ibsCompiler
 
             var optFileFinal = ResolvedOptionsPath;
 
+            // One stat answers both "is there a cache" and "how old is it".
             bool forceRebuild = _forceRebuild;
-            if (!File.Exists(optFileFinal))
-            {
+            var fi = new FileInfo(optFileFinal);
+            if (!fi.Exists || DateTime.Now.Subtract(fi.CreationTime).TotalMinutes > 60)
                 forceRebuild = true;
-            }
-            else
-            {
-                var fi = new FileInfo(optFileFinal);
-                if (DateTime.Now.Subtract(fi.CreationTime).TotalMinutes > 60)
-                    forceRebuild = true;
-            }
 
             if (!forceRebuild)
             {
@@ -92,7 +87,8 @@ namespace ibsCompiler
                     ibs_compiler_common.WriteLine("Company Option File Missing! " + optFileCompany, _cmdvars.OutFile);
                     return false;
                 }
-                if (!File.Exists(optFileServer))
+                var hasServerOptions = File.Exists(optFileServer);
+                if (!hasServerOptions)
                 {
                     ibs_compiler_common.WriteLine("Warning! Server Option File Missing! " + optFileServer, _cmdvars.OutFile);
                 }
@@ -119,7 +115,7 @@ namespace ibsCompiler
                 if (!string.IsNullOrEmpty(_profile.Language))
                     tmpOptFileCompany.Add("&lang&".PadRight(40) + _profile.Language.PadRight(200));
 
-                if (File.Exists(optFileServer))
+                if (hasServerOptions)
                 {
                     tmpOptFileServer = ibs_compiler_common.GenerateCompileOptionFile(optFileServer);
                 }
@@ -149,19 +145,17 @@ namespace ibsCompiler
             if (_arrOptions.Count == 0) return false;
             int lineNo = 0;
             string? line = "";
-            using var source = new StreamReader(sourceFile);
+            using var source = new StreamReader(sourceFile, System.Text.Encoding.UTF8, true, ibs_compiler_common.DataFileBufferSize);
             try
             {
                 while ((line = source.ReadLine()) != null)
                 {
                     lineNo++;
-                    if (line.Trim().Length > 0 && line.Substring(0, 2).Trim() == "->")
+                    if (line.StartsWith("->", StringComparison.Ordinal))
                     {
-                        var dbName = line.Substring(2, line.IndexOf("&") - 2).Trim();
-                        int iStart = 0;
-                        int i = line.IndexOf("&", iStart);
-                        iStart = i + 1;
-                        int j = line.IndexOf("&", iStart);
+                        int i = line.IndexOf('&');
+                        int j = line.IndexOf('&', i + 1);
+                        var dbName = line.Substring(2, i - 2).Trim();
                         var optValue = line.Substring(i, j - i + 1);
                         var dbLocation = ReplaceWord(optValue);
                         if (_profile.ServerType == SQLServerTypes.POSTGRES)
@@ -181,23 +175,114 @@ namespace ibsCompiler
             return true;
         }
 
+        // _arrOptions parsed into (token, value) pairs, kept in list order. Tokens of the usual
+        // &name& shape are indexed by text so ReplaceWord can look up just the &...& spans a
+        // line contains; anything else is tried in order. Extended in place as the table
+        // merge appends to _arrOptions, rebuilt if the list itself is replaced.
+        private readonly List<(string Token, string Value)> _tokens = new();
+        private readonly Dictionary<string, List<int>> _tokenIndex = new(StringComparer.Ordinal);
+        private readonly List<int> _irregularTokens = new();
+        private List<string>? _indexedOptions;
+        private int _indexedLines;
+
+        // (line, sequence) -> ReplaceOptions result. Compile passes resolve the same headers
+        // and boilerplate lines over and over; dropped whenever the option list changes.
+        private readonly Dictionary<(string Text, int Sequence), string> _replaced = new();
+        private const int ReplacedCacheLimit = 16384;
+
+        private void IndexOptions()
+        {
+            if (ReferenceEquals(_indexedOptions, _arrOptions) && _indexedLines == _arrOptions.Count)
+                return;
+            _replaced.Clear();
+            if (!ReferenceEquals(_indexedOptions, _arrOptions))
+            {
+                _tokens.Clear();
+                _tokenIndex.Clear();
+                _irregularTokens.Clear();
+                _indexedOptions = _arrOptions;
+                _indexedLines = 0;
+            }
+            for (; _indexedLines < _arrOptions.Count; _indexedLines++)
+            {
+                var line = _arrOptions[_indexedLines];
+                if (line.Length < 40) continue;
+                var token = line.Substring(0, 40).Trim();
+                int idx = _tokens.Count;
+                _tokens.Add((token, line.Substring(40).Trim()));
+                if (token.Length >= 2 && token[0] == '&' && token[^1] == '&' && token.IndexOf('&', 1, token.Length - 2) < 0)
+                {
+                    if (!_tokenIndex.TryGetValue(token, out var positions))
+                        _tokenIndex[token] = positions = new List<int>();
+                    positions.Add(idx);
+                }
+                else
+                {
+                    _irregularTokens.Add(idx);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Replaces option tokens in myText. Same result as applying every option's
+        /// Replace in list order (a value that introduces a later token is resolved too),
+        /// but only the options actually present in the text are applied.
+        /// </summary>
         public string ReplaceWord(string myText)
         {
             if (_arrOptions.Count == 0) return myText;
-            foreach (var line in _arrOptions)
+            IndexOptions();
+
+            int last = -1;
+            while (myText.Contains('&'))
             {
-                if (!myText.Contains("&")) return myText;
-                if (line.Length >= 40)
-                    myText = myText.Replace(line.Substring(0, 40).Trim(), line.Substring(40).Trim());
+                // Earliest option after the last one applied whose token is in the text.
+                // A regular token can only sit between two consecutive '&'s.
+                int next = int.MaxValue;
+                for (int i = myText.IndexOf('&'), j; i >= 0 && (j = myText.IndexOf('&', i + 1)) > 0; i = j)
+                {
+                    if (!_tokenIndex.TryGetValue(myText.Substring(i, j - i + 1), out var positions)) continue;
+                    foreach (var pos in positions)
+                    {
+                        if (pos > last)
+                        {
+                            if (pos < next) next = pos;
+                            break;
+                        }
+                    }
+                }
+                foreach (var pos in _irregularTokens)
+                {
+                    if (pos >= next) break;
+                    if (pos > last && myText.Contains(_tokens[pos].Token))
+                    {
+                        next = pos;
+                        break;
+                    }
+                }
+                if (next == int.MaxValue) break;
+
+                myText = myText.Replace(_tokens[next].Token, _tokens[next].Value);
+                last = next;
             }
             return myText;
         }
 
         public string ReplaceOptions(string sourceString, int sequence = -1)
         {
-            if (sequence > -1)
-                sourceString = sourceString.Replace("@sequence@", sequence.ToString());
-            return ReplaceWord(sourceString);
+            if (_arrOptions.Count == 0 || !sourceString.Contains('&'))
+                return sequence > -1 ? sourceString.Replace("@sequence@", sequence.ToString()) : sourceString;
+
+            IndexOptions();
+            var key = (sourceString, sequence);
+            if (_replaced.TryGetValue(key, out var cached))
+                return cached;
+
+            var result = ReplaceWord(sequence > -1 ? sourceString.Replace("@sequence@", sequence.ToString()) : sourceString);
+            if (_replaced.Count >= ReplacedCacheLimit)
+                _replaced.Clear();
+            _replaced[key] = result;
+            return result;
         }
 
         public List<string> ReplaceOptions(List<string> sourceStrings)
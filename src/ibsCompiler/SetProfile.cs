@@ -232,9 +232,14 @@ namespace ibsCompiler
         {
             try
             {
-                var options = new JsonSerializerOptions { WriteIndented = true };
-                var json = JsonSerializer.Serialize(_settings, options);
-                File.WriteAllText(_settingsPath, json);
+                var json = JsonSerializer.Serialize(_settings, ProfileManager.SettingsWriteOptions);
+                // Atomic replace: a crash mid-write or a compiler starting in parallel never
+                // sees a truncated settings.json (same guarantee as CleanupSettings, SR 52910).
+                if (!ibs_compiler_common.WriteAllTextAtomic(_settingsPath, json))
+                {
+                    PrintError($"Error saving settings: could not write {_settingsPath}");
+                    return false;
+                }
                 PrintSuccess($"Settings saved to: {_settingsPath}");
                 return true;
             }
@@ -858,8 +863,8 @@ namespace ibsCompiler
                 return;
             }
 
-            // Work on a JSON clone so a cancel leaves the stored profile untouched.
-            var working = JsonSerializer.Deserialize<ProfileData>(JsonSerializer.Serialize(profile))!;
+            // Work on a clone so a cancel leaves the stored profile untouched.
+            var working = CloneProfile(profile);
             var outcome = ProfileEditor.Edit(name, working, isCreate: false,
                 (p, kind) => RunNamedTest(kind, name, p, interactive: true), ValidateAliasConflicts,
                 allowCopyDelete: true);
@@ -911,6 +916,18 @@ namespace ibsCompiler
             dst.Aliases = src.Aliases;
         }
 
+        /// <summary>
+        /// Field-by-field clone of a profile (own Aliases list). Replaces the old
+        /// serialize/deserialize round-trip, which paid for a full JSON pass per copy.
+        /// </summary>
+        private static ProfileData CloneProfile(ProfileData src)
+        {
+            var clone = new ProfileData();
+            CopyProfileInto(clone, src);
+            clone.Aliases = src.Aliases?.ToList() ?? new List<string>();
+            return clone;
+        }
+
         private static void EditProfileSequential(string name, ProfileData profile)
         {
             Console.WriteLine();
@@ -1005,8 +1022,7 @@ namespace ibsCompiler
         {
             // Snapshot = the prefilled clone, so every carried-over field shows clean
             // until edited; name + aliases start blank and the name is required.
-            var json = JsonSerializer.Serialize(sourceProfile);
-            var working = JsonSerializer.Deserialize<ProfileData>(json)!;
+            var working = CloneProfile(sourceProfile);
             working.Aliases = new List<string>();
 
             var nameHolder = new ProfileEditor.NameHolder { Value = "" };
@@ -1058,8 +1074,7 @@ namespace ibsCompiler
                 return;
             }
 
-            var json = JsonSerializer.Serialize(sourceProfile);
-            var newProfile = JsonSerializer.Deserialize<ProfileData>(json)!;
+            var newProfile = CloneProfile(sourceProfile);
             newProfile.Aliases = new List<string>();
 
             _settings.Profiles[newName] = newProfile;
@@ -1620,8 +1635,8 @@ namespace ibsCompiler
             // the short-name directories on disk natively, so every entry is a
             // no-op; legacy long-name trees (95.sql and earlier) get the shortcuts
             // created here.
-            var defs = ibs_compiler_common.ShortcutDefinitionsFor(profile.SqlSource);
-            if (ibs_compiler_common.ParseCreateLinks(profile.SqlSource).Count > 0)
+            var defs = ibs_compiler_common.ShortcutDefinitionsFor(profile.SqlSource, out var fromScript);
+            if (fromScript)
                 PrintDim($"  Source: {Path.Combine(profile.SqlSource, "create_links.sh")} ({defs.Count} entries)");
             else
                 PrintDim($"  Source: built-in shortcut list ({defs.Count} entries; no create_links.sh in SQL root)");
@@ -2097,15 +2112,14 @@ namespace ibsCompiler
         #region Helpers
         private static (string Name, ProfileData Profile)? FindProfile(string nameOrAlias)
         {
-            var upper = nameOrAlias.ToUpperInvariant();
             foreach (var kvp in _settings.Profiles)
             {
-                if (kvp.Key.ToUpperInvariant() == upper)
+                if (string.Equals(kvp.Key, nameOrAlias, StringComparison.OrdinalIgnoreCase))
                     return (kvp.Key, kvp.Value);
             }
             foreach (var kvp in _settings.Profiles)
             {
-                if (kvp.Value.Aliases?.Any(a => a.ToUpperInvariant() == upper) == true)
+                if (kvp.Value.Aliases?.Any(a => string.Equals(a, nameOrAlias, StringComparison.OrdinalIgnoreCase)) == true)
                     return (kvp.Key, kvp.Value);
             }
             return null;
@@ -2142,14 +2156,13 @@ namespace ibsCompiler
         {
             foreach (var alias in aliases)
             {
-                var upper = alias.ToUpperInvariant();
                 foreach (var kvp in _settings.Profiles)
                 {
                     if (string.Equals(kvp.Key, profileName, StringComparison.OrdinalIgnoreCase)) continue;
-                    if (kvp.Key.ToUpperInvariant() == upper)
-                        return $"Alias '{upper}' conflicts with profile name '{kvp.Key}'.";
-                    if (kvp.Value.Aliases?.Any(a => a.ToUpperInvariant() == upper) == true)
-                        return $"Alias '{upper}' is already used by profile '{kvp.Key}'.";
+                    if (string.Equals(kvp.Key, alias, StringComparison.OrdinalIgnoreCase))
+                        return $"Alias '{alias.ToUpperInvariant()}' conflicts with profile name '{kvp.Key}'.";
+                    if (kvp.Value.Aliases?.Any(a => string.Equals(a, alias, StringComparison.OrdinalIgnoreCase)) == true)
+                        return $"Alias '{alias.ToUpperInvariant()}' is already used by profile '{kvp.Key}'.";
                 }
             }
             return null;
@@ -2344,12 +2357,12 @@ namespace ibsCompiler
                         foreach (var kvp in _settings.Profiles)
                         {
                             if (string.Equals(kvp.Key, name, StringComparison.OrdinalIgnoreCase)) continue;
-                            if (kvp.Key.ToUpperInvariant() == alias)
+                            if (string.Equals(kvp.Key, alias, StringComparison.OrdinalIgnoreCase))
                             {
                                 Console.Error.WriteLine($"ERROR: alias '{alias}' conflicts with profile name '{kvp.Key}'.");
                                 return 1;
                             }
-                            if (kvp.Value.Aliases?.Any(x => x.ToUpperInvariant() == alias) == true)
+                            if (kvp.Value.Aliases?.Any(x => string.Equals(x, alias, StringComparison.OrdinalIgnoreCase)) == true)
                             {
                                 Console.Error.WriteLine($"ERROR: alias '{alias}' already used by profile '{kvp.Key}'.");
                                 return 1;
@@ -1,3 +1,4 @@
+using System.Text.RegularExpressions;
 using ibsCompiler.Configuration;
 using ibsCompiler.Database;
 
@@ -10,7 +11,8 @@ namespace ibsCompiler.TransferData
     public class DatabaseDiscovery
     {
         /// <summary>
-        /// Test connectivity by running SELECT 1.
+        /// Test connectivity by opening and closing a session. The login is the test, so no
+        /// query is run and no result set is captured and formatted.
         /// </summary>
         public static bool TestConnection(ConnectionConfig conn)
         {
@@ -18,8 +20,9 @@ namespace ibsCompiler.TransferData
             {
                 var profile = BuildProfile(conn);
                 using var executor = SqlExecutorFactory.Create(profile);
-                var result = executor.ExecuteSql("SELECT 1", "", captureOutput: true);
-                return result.Returncode;
+                executor.OpenConnection("");
+                executor.CloseConnection();
+                return true;
             }
             catch
             {
@@ -32,7 +35,8 @@ namespace ibsCompiler.TransferData
         /// </summary>
         public static List<string> GetDatabases(ConnectionConfig conn)
         {
-            var platform = ibs_compiler_common.ParsePlatform(conn.Platform);
+            var profile = BuildProfile(conn);
+            var platform = profile.ServerType;
             string sql;
             string db;
             if (platform == SQLServerTypes.POSTGRES)
@@ -51,15 +55,18 @@ namespace ibsCompiler.TransferData
                 db = "master";
             }
 
-            return QueryColumn(conn, sql, db);
+            return QueryColumn(profile, sql, db);
         }
 
         /// <summary>
         /// Get list of user tables from a specific database.
         /// </summary>
         public static List<string> GetTables(ConnectionConfig conn, string database)
+            => GetTables(BuildProfile(conn), database);
+
+        private static List<string> GetTables(ResolvedProfile profile, string database)
         {
-            var platform = ibs_compiler_common.ParsePlatform(conn.Platform);
+            var platform = profile.ServerType;
             string sql;
             if (platform == SQLServerTypes.POSTGRES)
                 sql = "SELECT table_name FROM information_schema.tables WHERE table_schema NOT IN ('pg_catalog','information_schema') AND table_type='BASE TABLE' ORDER BY table_name";
@@ -68,9 +75,65 @@ namespace ibsCompiler.TransferData
             else
                 sql = "SELECT name FROM sysobjects WHERE type='U' ORDER BY name";
 
-            return QueryColumn(conn, sql, database);
+            return QueryColumn(profile, sql, database);
+        }
+
+        /// <summary>
+        /// Get user tables for several databases in one round-trip. SYBASE and MSSQL run a
+        /// single UNION ALL over the databases' catalogs from master instead of opening one
+        /// connection per database; POSTGRES cannot query across databases, so it (and any
+        /// server where the combined query returns nothing, e.g. one database is offline)
+        /// falls back to <see cref="GetTables"/> per database. So does a SYBASE database whose
+        /// name is not a plain identifier, since it cannot be spliced into db..sysobjects.
+        /// </summary>
+        public static Dictionary<string, List<string>> GetTablesByDatabase(ConnectionConfig conn, IReadOnlyCollection<string> databases)
+        {
+            var result = new Dictionary<string, List<string>>();
+            foreach (var db in databases)
+                result[db] = new List<string>();
+            if (databases.Count == 0) return result;
+
+            var profile = BuildProfile(conn);
+            var platform = profile.ServerType;
+            var perDatabase = databases.ToList();
+            if (platform != SQLServerTypes.POSTGRES)
+            {
+                // Each row is "<index>|<table>": the index into `combined` is digits only, so
+                // the first '|' always ends it, whatever padding or characters the name has.
+                var combined = platform == SQLServerTypes.MSSQL
+                    ? perDatabase
+                    : perDatabase.Where(db => PlainIdentifier.IsMatch(db)).ToList();
+                perDatabase = perDatabase.Except(combined).ToList();
+
+                if (combined.Count > 0)
+                {
+                    var selects = combined.Select((db, index) => platform == SQLServerTypes.MSSQL
+                        ? $"SELECT '{index}|' + name AS tbl FROM [{db.Replace("]", "]]")}].sys.tables"
+                        : $"SELECT '{index}|' + name AS tbl FROM {db}..sysobjects WHERE type='U'");
+                    var sql = string.Join(" UNION ALL ", selects) + " ORDER BY 1";
+
+                    bool any = false;
+                    foreach (var line in QueryColumn(profile, sql, "master"))
+                    {
+                        var bar = line.IndexOf('|');
+                        if (bar > 0 && int.TryParse(line.AsSpan(0, bar), out var index) && index < combined.Count)
+                        {
+                            result[combined[index]].Add(line.Substring(bar + 1).TrimEnd());
+                            any = true;
+                        }
+                    }
+                    if (!any) perDatabase.AddRange(combined);
+                }
+            }
+
+            foreach (var db in perDatabase)
+                result[db] = GetTables(profile, db);
+            return result;
         }
 
+        // Database names that can be used unquoted in a SYBASE db..object reference.
+        private static readonly Regex PlainIdentifier = new(@"^[A-Za-z_#@][A-Za-z0-9_#@$]*$", RegexOptions.Compiled);
+
         /// <summary>
         /// Get approximate row count for a table.
         /// </summary>
@@ -79,7 +142,7 @@ namespace ibsCompiler.TransferData
             try
             {
                 var sql = $"SELECT COUNT(*) FROM {table}";
-                var results = QueryColumn(conn, sql, database);
+                var results = QueryColumn(BuildProfile(conn), sql, database);
                 if (results.Count > 0 && long.TryParse(results[0].Trim(), out var count))
                     return count;
             }
@@ -87,28 +150,27 @@ namespace ibsCompiler.TransferData
             return -1;
         }
 
-        private static List<string> QueryColumn(ConnectionConfig conn, string sql, string database)
+        private static List<string> QueryColumn(ResolvedProfile profile, string sql, string database)
         {
             try
             {
-                var profile = BuildProfile(conn);
                 using var executor = SqlExecutorFactory.Create(profile);
                 var result = executor.ExecuteSql(sql, database, captureOutput: true);
                 if (!result.Returncode || string.IsNullOrEmpty(result.Output))
                     return new List<string>();
 
                 // Parse captured output — each line may have column headers and dashes,
-                // then data rows. Skip header lines.
-                var lines = result.Output.Split('\n', StringSplitOptions.RemoveEmptyEntries);
+                // then data rows. Skip header lines. Lines are scanned as spans so only
+                // the data rows themselves are allocated.
                 var data = new List<string>();
                 bool pastHeader = false;
-                foreach (var rawLine in lines)
+                foreach (var rawLine in result.Output.AsSpan().EnumerateLines())
                 {
                     var line = rawLine.Trim();
-                    if (string.IsNullOrEmpty(line)) continue;
+                    if (line.IsEmpty) continue;
 
                     // Skip header separator (dashes)
-                    if (line.All(c => c == '-' || c == ' '))
+                    if (line.IndexOfAnyExcept('-', ' ') < 0)
                     {
                         pastHeader = true;
                         continue;
@@ -121,9 +183,9 @@ namespace ibsCompiler.TransferData
                     }
 
                     // Skip rows affected messages
-                    if (line.StartsWith("(") && line.Contains("row")) continue;
+                    if (line[0] == '(' && line.Contains("row", StringComparison.Ordinal)) continue;
 
-                    data.Add(line.Trim());
+                    data.Add(line.ToString());
                 }
                 return data;
             }
@@ -1,3 +1,5 @@
+using System.Text;
+
 namespace ibsCompiler.TransferData
 {
     /// <summary>
@@ -14,7 +16,11 @@ namespace ibsCompiler.TransferData
             if (!Console.IsInputRedirected && Console.IsOutputRedirected)
                 return FallbackSelect(prompt, items, preSelected);
 
-            var selected = new HashSet<string>(preSelected ?? new HashSet<string>());
+            // Selection state as a flat array indexed like items — Render reads it per visible row.
+            var selected = new bool[items.Count];
+            if (preSelected != null)
+                for (int i = 0; i < items.Count; i++)
+                    selected[i] = preSelected.Contains(items[i]);
             int cursor = 0;
             int scrollOffset = 0;
             int visibleRows = Math.Min(items.Count, Math.Max(Console.WindowHeight - 4, 5));
@@ -24,27 +30,29 @@ namespace ibsCompiler.TransferData
             Console.WriteLine();
 
             int startRow = Console.CursorTop;
+            var frame = new StringBuilder();
 
+            // Build the whole frame, then write it in one call so the terminal gets a single
+            // write per redraw instead of one per row.
             void Render()
             {
-                Console.SetCursorPosition(0, startRow);
+                frame.Clear();
+                // WindowWidth is a terminal query on every read; take it once per frame.
+                int width = Console.WindowWidth - 1;
                 for (int i = 0; i < visibleRows; i++)
                 {
                     int idx = scrollOffset + i;
                     if (idx >= items.Count) break;
 
-                    var marker = selected.Contains(items[idx]) ? "[x]" : "[ ]";
-                    var pointer = idx == cursor ? ">" : " ";
-                    var line = $"  {pointer} {marker} {items[idx]}";
-                    // Pad to clear previous content
-                    if (line.Length < Console.WindowWidth - 1)
-                        line = line.PadRight(Console.WindowWidth - 1);
-                    else
-                        line = line.Substring(0, Console.WindowWidth - 1);
-                    Console.Write(line);
+                    var prefix = idx == cursor
+                        ? (selected[idx] ? "  > [x] " : "  > [ ] ")
+                        : (selected[idx] ? "    [x] " : "    [ ] ");
+                    AppendRow(frame, prefix, items[idx], width);
                     if (i < visibleRows - 1)
-                        Console.WriteLine();
+                        frame.AppendLine();
                 }
+                Console.SetCursorPosition(0, startRow);
+                Console.Write(frame.ToString());
                 Console.SetCursorPosition(0, startRow + (cursor - scrollOffset));
             }
 
@@ -78,26 +86,23 @@ namespace ibsCompiler.TransferData
                             break;
 
                         case ConsoleKey.Spacebar:
-                            if (selected.Contains(items[cursor]))
-                                selected.Remove(items[cursor]);
-                            else
-                                selected.Add(items[cursor]);
+                            selected[cursor] = !selected[cursor];
                             break;
 
                         case ConsoleKey.A:
-                            foreach (var item in items) selected.Add(item);
+                            Array.Fill(selected, true);
                             break;
 
                         case ConsoleKey.N:
-                            selected.Clear();
+                            Array.Clear(selected);
                             break;
 
                         case ConsoleKey.Enter:
                             Console.SetCursorPosition(0, startRow + visibleRows);
                             Console.WriteLine();
-                            var count = selected.Count;
-                            Console.WriteLine($"  Selected {count} of {items.Count} items.");
-                            return items.Where(i => selected.Contains(i)).ToList();
+                            var chosen = items.Where((_, i) => selected[i]).ToList();
+                            Console.WriteLine($"  Selected {chosen.Count} of {items.Count} items.");
+                            return chosen;
 
                         case ConsoleKey.Escape:
                         case ConsoleKey.Q:
@@ -107,7 +112,10 @@ namespace ibsCompiler.TransferData
                             return null;
                     }
 
-                    Render();
+                    // Coalesce redraws: while keys are still queued (held arrow key, fast typing)
+                    // apply them first and draw only the final state.
+                    if (!Console.KeyAvailable)
+                        Render();
                 }
             }
             finally
@@ -129,23 +137,27 @@ namespace ibsCompiler.TransferData
         {
             if (rows.Count == 0) return new List<string>();
 
-            // Build list of selectable indices
+            // Build list of selectable indices; header/selection state as flat arrays indexed
+            // like rows, so Render doesn't hash every visible row.
+            var isHeader = new bool[rows.Count];
             var selectableIndices = new List<int>();
             for (int i = 0; i < rows.Count; i++)
-                if (!headerIndices.Contains(i))
+            {
+                isHeader[i] = headerIndices.Contains(i);
+                if (!isHeader[i])
                     selectableIndices.Add(i);
+            }
 
             if (selectableIndices.Count == 0) return new List<string>();
 
             if (!Console.IsInputRedirected && Console.IsOutputRedirected)
                 return FallbackSelectWithSections(prompt, rows, headerIndices, preSelected);
 
-            var selected = new HashSet<int>();
+            var selected = new bool[rows.Count];
             if (preSelected != null)
             {
                 foreach (var idx in selectableIndices)
-                    if (preSelected.Contains(rows[idx]))
-                        selected.Add(idx);
+                    selected[idx] = preSelected.Contains(rows[idx]);
             }
 
             int cursorPos = 0; // index into selectableIndices
@@ -165,36 +177,35 @@ namespace ibsCompiler.TransferData
 
             // Calculate startRow now that all lines are in the buffer
             int startRow = footerEnd - 2 - visibleRows;
+            var frame = new StringBuilder();
 
             void Render()
             {
-                Console.SetCursorPosition(0, startRow);
+                frame.Clear();
+                int width = Console.WindowWidth - 1;
                 for (int i = 0; i < visibleRows; i++)
                 {
                     int rowIdx = scrollOffset + i;
                     if (rowIdx >= rows.Count) break;
 
-                    string line;
-                    if (headerIndices.Contains(rowIdx))
+                    string prefix;
+                    if (isHeader[rowIdx])
                     {
                         // Section header — no checkbox, no pointer
-                        line = $"  {rows[rowIdx]}";
+                        prefix = "  ";
                     }
                     else
                     {
-                        var marker = selected.Contains(rowIdx) ? "[x]" : "[ ]";
-                        var pointer = selectableIndices[cursorPos] == rowIdx ? ">" : " ";
-                        line = $"  {pointer} {marker}  {rows[rowIdx]}";
+                        prefix = selectableIndices[cursorPos] == rowIdx
+                            ? (selected[rowIdx] ? "  > [x]  " : "  > [ ]  ")
+                            : (selected[rowIdx] ? "    [x]  " : "    [ ]  ");
                     }
-
-                    if (line.Length < Console.WindowWidth - 1)
-                        line = line.PadRight(Console.WindowWidth - 1);
-                    else
-                        line = line.Substring(0, Console.WindowWidth - 1);
-                    Console.Write(line);
+                    AppendRow(frame, prefix, rows[rowIdx], width);
                     if (i < visibleRows - 1)
-                        Console.WriteLine();
+                        frame.AppendLine();
                 }
+                Console.SetCursorPosition(0, startRow);
+                Console.Write(frame.ToString());
 
                 // Position cursor on the current selectable row
                 int cursorRowIdx = selectableIndices[cursorPos];
@@ -235,26 +246,23 @@ namespace ibsCompiler.TransferData
                         case ConsoleKey.Spacebar:
                         {
                             int idx = selectableIndices[cursorPos];
-                            if (selected.Contains(idx))
-                                selected.Remove(idx);
-                            else
-                                selected.Add(idx);
+                            selected[idx] = !selected[idx];
                             break;
                         }
 
                         case ConsoleKey.A:
-                            foreach (var idx in selectableIndices) selected.Add(idx);
+                            foreach (var idx in selectableIndices) selected[idx] = true;
                             break;
 
                         case ConsoleKey.N:
-                            selected.Clear();
+                            Array.Clear(selected);
                             break;
 
                         case ConsoleKey.Enter:
                             Console.SetCursorPosition(0, footerEnd);
                             Console.WriteLine();
                             return selectableIndices
-                                .Where(i => selected.Contains(i))
+                                .Where(i => selected[i])
                                 .Select(i => rows[i])
                                 .ToList();
 
@@ -266,7 +274,10 @@ namespace ibsCompiler.TransferData
                             return null;
                     }
 
-                    Render();
+                    // Coalesce redraws: while keys are still queued (held arrow key, fast typing)
+                    // apply them first and draw only the final state.
+                    if (!Console.KeyAvailable)
+                        Render();
                 }
             }
             finally
@@ -275,6 +286,26 @@ namespace ibsCompiler.TransferData
             }
         }
 
+        /// <summary>
+        /// Appends prefix + text to the frame, cut or space-padded to exactly width columns
+        /// (padding clears whatever the previous frame left on the row).
+        /// </summary>
+        private static void AppendRow(StringBuilder frame, string prefix, string text, int width)
+        {
+            if (width <= 0) return;
+            if (prefix.Length >= width)
+            {
+                frame.Append(prefix, 0, width);
+                return;
+            }
+            frame.Append(prefix);
+            int room = width - prefix.Length;
+            if (text.Length >= room)
+                frame.Append(text, 0, room);
+            else
+                frame.Append(text).Append(' ', room - text.Length);
+        }
+
         private static List<string>? FallbackSelectWithSections(
             string prompt, List<string> rows, HashSet<int> headerIndices, HashSet<string>? preSelected)
         {
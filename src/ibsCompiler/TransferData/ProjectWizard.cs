@@ -185,14 +185,18 @@ namespace ibsCompiler.TransferData
 
         public static void SelectTables(TransferProjectConfig config)
         {
+            Console.Write($"  Fetching tables from {config.Databases.Count} database(s)... ");
+            var tablesByDb = DatabaseDiscovery.GetTablesByDatabase(config.Source, config.Databases.Keys);
+            Console.WriteLine("done.");
+
             foreach (var kvp in config.Databases)
             {
                 var dbName = kvp.Key;
                 var mapping = kvp.Value;
 
                 Console.WriteLine();
-                Console.Write($"  Fetching tables from '{dbName}'... ");
-                var tables = DatabaseDiscovery.GetTables(config.Source, dbName);
+                Console.Write($"  Tables in '{dbName}': ");
+                var tables = tablesByDb[dbName];
                 if (tables.Count == 0)
                 {
                     Console.WriteLine("none found.");
@@ -223,7 +227,8 @@ namespace ibsCompiler.TransferData
             var options = new TransferOptions
             {
                 Mode = current.Mode,
-                BatchSize = current.BatchSize
+                BatchSize = current.BatchSize,
+                Parallelism = current.Parallelism
             };
 
             Console.Write($"  Mode (TRUNCATE/APPEND) [{options.Mode}]: ");
@@ -236,6 +241,13 @@ namespace ibsCompiler.TransferData
             if (!string.IsNullOrEmpty(input) && int.TryParse(input, out var batch))
                 options.BatchSize = batch;
 
+            Console.Write($"  Parallel tables (0=auto) [{(options.Parallelism > 0 ? options.Parallelism : "auto")}]: ");
+            input = Console.ReadLine()?.Trim();
+            if (string.Equals(input, "auto", StringComparison.OrdinalIgnoreCase))
+                options.Parallelism = 0;
+            else if (!string.IsNullOrEmpty(input) && int.TryParse(input, out var parallel) && parallel >= 0)
+                options.Parallelism = parallel;
+
             return options;
         }
 
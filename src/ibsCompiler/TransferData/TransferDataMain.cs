@@ -72,7 +72,7 @@ namespace ibsCompiler.TransferData
             Console.WriteLine();
             Console.WriteLine($"  Source:       {config.Source.Platform} {config.Source.Host}:{config.Source.Port}  user={config.Source.Username}");
             Console.WriteLine($"  Destination:  {config.Destination.Platform} {config.Destination.Host}:{config.Destination.Port}  user={config.Destination.Username}");
-            Console.WriteLine($"  Mode:         {config.Options.Mode}  batch={config.Options.BatchSize}");
+            Console.WriteLine($"  Mode:         {config.Options.Mode}  batch={config.Options.BatchSize}  parallel={(config.Options.Parallelism > 0 ? config.Options.Parallelism : "auto")}");
             Console.WriteLine();
 
             foreach (var db in config.Databases)
@@ -229,6 +229,15 @@ namespace ibsCompiler.TransferData
             return null;
         }
 
+        /// <summary>
+        /// Command used to open a file with its associated application, resolved once
+        /// per process. Null on Windows, where the shell handles the association.
+        /// </summary>
+        private static readonly string? ShellOpenCommand =
+            OperatingSystem.IsWindows() ? null
+            : OperatingSystem.IsMacOS() ? "open"
+            : "xdg-open";
+
         private static void OpenSettings(TransferProjectStore store)
         {
             var path = store.SettingsPath;
@@ -236,8 +245,7 @@ namespace ibsCompiler.TransferData
 
             try
             {
-                if (System.Runtime.InteropServices.RuntimeInformation.IsOSPlatform(
-                    System.Runtime.InteropServices.OSPlatform.Windows))
+                if (ShellOpenCommand == null)
                 {
                     System.Diagnostics.Process.Start(new System.Diagnostics.ProcessStartInfo
                     {
@@ -247,10 +255,7 @@ namespace ibsCompiler.TransferData
                 }
                 else
                 {
-                    // Try xdg-open on Linux, open on macOS
-                    var cmd = System.Runtime.InteropServices.RuntimeInformation.IsOSPlatform(
-                        System.Runtime.InteropServices.OSPlatform.OSX) ? "open" : "xdg-open";
-                    System.Diagnostics.Process.Start(cmd, path);
+                    System.Diagnostics.Process.Start(ShellOpenCommand, path);
                 }
             }
             catch
@@ -37,5 +37,10 @@ namespace ibsCompiler.TransferData
     {
         public string Mode { get; set; } = "TRUNCATE";
         public int BatchSize { get; set; } = 1000;
+        /// <summary>
+        /// Tables transferred at once. Defaults to 1 (one table at a time, as projects saved
+        /// before this setting existed ran); 0 = auto (one per available processor).
+        /// </summary>
+        public int Parallelism { get; set; } = 1;
     }
 }
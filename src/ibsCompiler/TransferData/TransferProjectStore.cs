@@ -7,10 +7,17 @@ namespace ibsCompiler.TransferData
     /// <summary>
     /// Reads/writes transfer projects from the "data_transfer" section of settings.json.
     /// Uses JsonNode for partial read/write — never touches the "Profiles" section.
+    /// Writes go through WriteAllTextAtomic so a reader never sees a half-written file.
     /// </summary>
     public class TransferProjectStore
     {
         private readonly string _settingsPath;
+
+        // Project names cached against settings.json's last write time. The transfer_data
+        // menu lists projects on every loop; this skips re-reading and deserializing every
+        // project config just to show their names. Save/Delete refresh it after writing.
+        private IReadOnlyList<string>? _projectNames;
+        private DateTime _projectNamesStamp;
         private static readonly JsonSerializerOptions JsonOpts = new()
         {
             PropertyNameCaseInsensitive = true,
@@ -75,15 +82,19 @@ namespace ibsCompiler.TransferData
                 root = new JsonObject();
             }
 
-            // Ensure data_transfer section exists
-            if (root["data_transfer"] == null)
-                root["data_transfer"] = new JsonObject();
+            // Ensure data_transfer section exists (one lookup, then reuse the node)
+            if (root["data_transfer"] is not JsonObject dt)
+            {
+                dt = new JsonObject();
+                root["data_transfer"] = dt;
+            }
 
             // Serialize the project config and insert
-            var configNode = JsonSerializer.SerializeToNode(config, JsonOpts);
-            root["data_transfer"]![projectName] = configNode;
+            dt[projectName] = JsonSerializer.SerializeToNode(config, JsonOpts);
 
-            File.WriteAllText(_settingsPath, root.ToJsonString(new JsonSerializerOptions { WriteIndented = true }));
+            if (!ibs_compiler_common.WriteAllTextAtomic(_settingsPath, root.ToJsonString(ProfileManager.SettingsWriteOptions)))
+                throw new IOException($"Could not write {_settingsPath}");
+            CacheProjectNames(dt);
         }
 
         public void Delete(string projectName)
@@ -93,19 +104,37 @@ namespace ibsCompiler.TransferData
             try
             {
                 var root = JsonNode.Parse(File.ReadAllText(_settingsPath));
-                var dt = root?["data_transfer"] as JsonObject;
-                if (dt != null && dt.ContainsKey(projectName))
+                // Remove() reports whether the key existed — no separate ContainsKey probe.
+                if (root?["data_transfer"] is JsonObject dt && dt.Remove(projectName))
                 {
-                    dt.Remove(projectName);
-                    File.WriteAllText(_settingsPath, root!.ToJsonString(new JsonSerializerOptions { WriteIndented = true }));
+                    if (ibs_compiler_common.WriteAllTextAtomic(_settingsPath, root!.ToJsonString(ProfileManager.SettingsWriteOptions)))
+                        CacheProjectNames(dt);
                 }
             }
             catch { }
         }
 
-        public List<string> ListProjects()
+        public IReadOnlyList<string> ListProjects()
+        {
+            var stamp = File.GetLastWriteTimeUtc(_settingsPath);
+            if (_projectNames != null && stamp == _projectNamesStamp)
+                return _projectNames;
+
+            JsonObject? dt = null;
+            if (File.Exists(_settingsPath))
+            {
+                try { dt = JsonNode.Parse(File.ReadAllText(_settingsPath))?["data_transfer"] as JsonObject; }
+                catch { }
+            }
+            _projectNames = dt?.Select(kvp => kvp.Key).ToList() ?? new List<string>();
+            _projectNamesStamp = stamp;
+            return _projectNames;
+        }
+
+        private void CacheProjectNames(JsonObject dt)
         {
-            return LoadAll().Keys.ToList();
+            _projectNames = dt.Select(kvp => kvp.Key).ToList();
+            _projectNamesStamp = File.GetLastWriteTimeUtc(_settingsPath);
         }
 
         public string SettingsPath => _settingsPath;
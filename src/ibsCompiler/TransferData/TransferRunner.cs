@@ -1,11 +1,15 @@
+using System.Collections.Concurrent;
+using System.Text;
 using System.Text.Json;
+using ibsCompiler.Configuration;
 using ibsCompiler.Database;
 
 namespace ibsCompiler.TransferData
 {
     /// <summary>
     /// Executes extract and insert phases for transfer_data projects.
-    /// Uses existing ISqlExecutor.BulkCopy() for managed BCP operations.
+    /// Uses existing ISqlExecutor.BulkCopy() for managed BCP operations; tables run
+    /// concurrently up to TransferOptions.Parallelism.
     /// </summary>
     public class TransferRunner
     {
@@ -13,6 +17,11 @@ namespace ibsCompiler.TransferData
         private readonly string _projectName;
         private readonly string _dataDir;
 
+        // Idle destination connections used for TRUNCATE, per destination database.
+        private readonly ConcurrentDictionary<string, ConcurrentBag<ISqlExecutor>> _truncateConnections = new();
+
+        private static readonly JsonSerializerOptions ManifestJsonOpts = new() { WriteIndented = true };
+
         public TransferRunner(string projectName, TransferProjectConfig config)
         {
             _projectName = projectName;
@@ -50,56 +59,32 @@ namespace ibsCompiler.TransferData
             Console.WriteLine();
 
             var sourceProfile = DatabaseDiscovery.BuildProfile(_config.Source);
-            int totalTables = _config.Databases.Sum(d => d.Value.Tables.Count);
+            var work = _config.Databases
+                .SelectMany(d => d.Value.Tables.Select(t => (Db: d.Key, Table: t)))
+                .ToList();
+            var manifests = _config.Databases.Keys.ToDictionary(db => db, _ => new Dictionary<string, long>());
             int current = 0;
             bool allOk = true;
 
-            foreach (var dbKvp in _config.Databases)
+            RunTables(work, w => ExtractTable(sourceProfile, w.Db, w.Table), (w, result) =>
             {
-                var dbName = dbKvp.Key;
-                var mapping = dbKvp.Value;
-                var manifest = new Dictionary<string, long>();
+                Console.WriteLine($"  [{++current}/{work.Count}] Extracting: {w.Db}..{w.Table}  {result.Text}");
+                if (result.Ok)
+                    manifests[w.Db][w.Table] = result.Rows;
+                else
+                    allOk = false;
+            });
 
-                foreach (var table in mapping.Tables)
+            // Write manifest for each database — once per run, via temp file + rename so an
+            // interrupted extract never leaves a truncated manifest for the insert phase.
+            foreach (var (dbName, manifest) in manifests)
+            {
+                var manifestPath = Path.Combine(_dataDir, $"{dbName}_manifest.json");
+                if (!ibs_compiler_common.WriteAllTextAtomic(manifestPath, JsonSerializer.Serialize(manifest, ManifestJsonOpts)))
                 {
-                    current++;
-                    var dataFile = Path.Combine(_dataDir, $"{dbName}_{table}.bcp");
-
-                    Console.Write($"  [{current}/{totalTables}] Extracting: {dbName}..{table}  ");
-
-                    try
-                    {
-                        using var executor = SqlExecutorFactory.Create(sourceProfile);
-                        var result = executor.BulkCopy($"{dbName}..{table}", BcpDirection.OUT, dataFile);
-
-                        if (result.Returncode)
-                        {
-                            long rowCount = 0;
-                            if (long.TryParse(result.Output?.Trim(), out var rc))
-                                rowCount = rc;
-                            else
-                                rowCount = CountFileLines(dataFile);
-
-                            manifest[table] = rowCount;
-                            Console.WriteLine($"{rowCount} rows  OK");
-                        }
-                        else
-                        {
-                            Console.WriteLine($"FAILED: {result.Output}");
-                            allOk = false;
-                        }
-                    }
-                    catch (Exception ex)
-                    {
-                        Console.WriteLine($"ERROR: {ex.Message}");
-                        allOk = false;
-                    }
+                    Console.WriteLine($"  Could not write manifest: {manifestPath}");
+                    allOk = false;
                 }
-
-                // Write manifest for this database
-                var manifestPath = Path.Combine(_dataDir, $"{dbName}_manifest.json");
-                File.WriteAllText(manifestPath, JsonSerializer.Serialize(manifest,
-                    new JsonSerializerOptions { WriteIndented = true }));
             }
 
             Console.WriteLine();
@@ -107,6 +92,29 @@ namespace ibsCompiler.TransferData
             return allOk;
         }
 
+        private TableResult ExtractTable(ResolvedProfile sourceProfile, string dbName, string table)
+        {
+            var dataFile = Path.Combine(_dataDir, $"{dbName}_{table}.bcp");
+            try
+            {
+                using var executor = SqlExecutorFactory.Create(sourceProfile);
+                var result = executor.BulkCopy($"{dbName}..{table}", BcpDirection.OUT, dataFile);
+                if (!result.Returncode)
+                    return new TableResult(false, $"FAILED: {result.Output}");
+
+                long rowCount = 0;
+                if (long.TryParse(result.Output?.Trim(), out var rc))
+                    rowCount = rc;
+                else
+                    rowCount = CountFileLines(dataFile);
+                return new TableResult(true, $"{rowCount} rows  OK", rowCount);
+            }
+            catch (Exception ex)
+            {
+                return new TableResult(false, $"ERROR: {ex.Message}");
+            }
+        }
+
         /// <summary>
         /// Insert phase: BulkCopy IN from data files to destination.
         /// </summary>
@@ -125,9 +133,7 @@ namespace ibsCompiler.TransferData
             Console.WriteLine();
 
             var destProfile = DatabaseDiscovery.BuildProfile(_config.Destination);
-            int totalTables = _config.Databases.Sum(d => d.Value.Tables.Count);
-            int current = 0;
-            bool allOk = true;
+            var work = new List<(string SrcDb, string DestDb, string Table, Dictionary<string, long> Manifest)>();
 
             foreach (var dbKvp in _config.Databases)
             {
@@ -149,57 +155,23 @@ namespace ibsCompiler.TransferData
                 }
 
                 foreach (var table in mapping.Tables)
-                {
-                    current++;
-                    var dataFile = Path.Combine(_dataDir, $"{srcDbName}_{table}.bcp");
-
-                    if (!File.Exists(dataFile))
-                    {
-                        Console.WriteLine($"  [{current}/{totalTables}] Skipping: {destDbName}..{table}  (no data file)");
-                        continue;
-                    }
+                    work.Add((srcDbName, destDbName, table, manifest));
+            }
 
-                    Console.Write($"  [{current}/{totalTables}] Inserting: {destDbName}..{table}  ");
+            int current = 0;
+            bool allOk = true;
 
-                    try
-                    {
-                        // TRUNCATE mode: clear destination table first
-                        if (_config.Options.Mode == "TRUNCATE")
-                        {
-                            using var executor = SqlExecutorFactory.Create(destProfile);
-                            var truncResult = executor.ExecuteSql($"TRUNCATE TABLE {table}", destDbName, captureOutput: true);
-                            if (!truncResult.Returncode)
-                            {
-                                Console.WriteLine($"TRUNCATE FAILED: {truncResult.Output}");
-                                allOk = false;
-                                continue;
-                            }
-                        }
-
-                        using var insertExecutor = SqlExecutorFactory.Create(destProfile);
-                        var result = insertExecutor.BulkCopy($"{destDbName}..{table}", BcpDirection.IN, dataFile);
-
-                        if (result.Returncode)
-                        {
-                            var expectedRows = manifest.TryGetValue(table, out var exp) ? exp : -1;
-                            var fileRows = CountFileLines(dataFile);
-                            var status = expectedRows >= 0 && fileRows != expectedRows
-                                ? $"WARNING: expected {expectedRows}"
-                                : "OK";
-                            Console.WriteLine($"{fileRows} rows  {status}");
-                        }
-                        else
-                        {
-                            Console.WriteLine($"FAILED: {result.Output}");
-                            allOk = false;
-                        }
-                    }
-                    catch (Exception ex)
-                    {
-                        Console.WriteLine($"ERROR: {ex.Message}");
-                        allOk = false;
-                    }
-                }
+            try
+            {
+                RunTables(work, w => InsertTable(destProfile, w.SrcDb, w.DestDb, w.Table, w.Manifest), (w, result) =>
+                {
+                    Console.WriteLine($"  [{++current}/{work.Count}] {result.Text}");
+                    if (!result.Ok) allOk = false;
+                });
+            }
+            finally
+            {
+                CloseTruncateConnections();
             }
 
             Console.WriteLine();
@@ -207,13 +179,153 @@ namespace ibsCompiler.TransferData
             return allOk;
         }
 
+        private TableResult InsertTable(ResolvedProfile destProfile, string srcDbName, string destDbName,
+            string table, Dictionary<string, long> manifest)
+        {
+            var dataFile = Path.Combine(_dataDir, $"{srcDbName}_{table}.bcp");
+            if (!File.Exists(dataFile))
+                return new TableResult(true, $"Skipping: {destDbName}..{table}  (no data file)");
+
+            var label = $"Inserting: {destDbName}..{table}  ";
+            try
+            {
+                // TRUNCATE mode: clear destination table first
+                if (_config.Options.Mode == "TRUNCATE")
+                {
+                    var truncResult = Truncate(destProfile, destDbName, table);
+                    if (!truncResult.Returncode)
+                        return new TableResult(false, label + $"TRUNCATE FAILED: {truncResult.Output}");
+                }
+
+                var expectedRows = manifest.TryGetValue(table, out var exp) ? exp : -1;
+
+                // Empty source table: the truncate above is all there is to do, so skip the
+                // bulk-copy connection and schema probe entirely.
+                if (new FileInfo(dataFile).Length == 0)
+                {
+                    var emptyStatus = expectedRows > 0 ? $"WARNING: expected {expectedRows}" : "OK";
+                    return new TableResult(true, label + $"0 rows  {emptyStatus}");
+                }
+
+                using var insertExecutor = SqlExecutorFactory.Create(destProfile);
+                var result = insertExecutor.BulkCopy($"{destDbName}..{table}", BcpDirection.IN, dataFile);
+                if (!result.Returncode)
+                    return new TableResult(false, label + $"FAILED: {result.Output}");
+
+                // BulkCopy reports the rows it loaded; only rescan the file if it didn't.
+                if (!long.TryParse(result.Output?.Trim(), out var loadedRows))
+                    loadedRows = CountFileLines(dataFile);
+                var status = expectedRows >= 0 && loadedRows != expectedRows
+                    ? $"WARNING: expected {expectedRows}"
+                    : "OK";
+                return new TableResult(true, label + $"{loadedRows} rows  {status}", loadedRows);
+            }
+            catch (Exception ex)
+            {
+                return new TableResult(false, label + $"ERROR: {ex.Message}");
+            }
+        }
+
+        /// <summary>
+        /// TRUNCATE on a destination connection kept open per database and reused across tables,
+        /// instead of a fresh connection (login + session setup) for every table. ExecuteBatch
+        /// reports a broken connection the same way as a SQL error (Returncode false), so any
+        /// failed TRUNCATE, like any exception, discards its connection rather than pooling it.
+        /// </summary>
+        private ExecReturn Truncate(ResolvedProfile destProfile, string destDbName, string table)
+        {
+            var idle = _truncateConnections.GetOrAdd(destDbName, _ => new ConcurrentBag<ISqlExecutor>());
+            if (!idle.TryTake(out var executor))
+            {
+                executor = SqlExecutorFactory.Create(destProfile);
+                try { executor.OpenConnection(destDbName); }
+                catch { executor.Dispose(); throw; }
+            }
+
+            bool reusable = false;
+            try
+            {
+                var result = executor.ExecuteBatch($"TRUNCATE TABLE {table}", captureOutput: true);
+                reusable = result.Returncode;
+                return result;
+            }
+            finally
+            {
+                if (reusable) idle.Add(executor);
+                else executor.Dispose();
+            }
+        }
+
+        private void CloseTruncateConnections()
+        {
+            foreach (var idle in _truncateConnections.Values)
+                while (idle.TryTake(out var executor))
+                    executor.Dispose();
+            _truncateConnections.Clear();
+        }
+
+        /// <summary>
+        /// Transfer tables at most Options.Parallelism at a time (each on its own executor and
+        /// connection), reporting results on the calling thread in table order. With more than
+        /// one slot, each table's executor progress is collected while it runs and printed just
+        /// before its result line, so tables never interleave; a single slot streams it live.
+        /// </summary>
+        private void RunTables<T>(IReadOnlyList<T> items, Func<T, TableResult> transfer, Action<T, TableResult> report)
+        {
+            // Auto: Environment.ProcessorCount already reflects the process affinity mask;
+            // never start more slots than there are tables.
+            var parallelism = _config.Options.Parallelism > 0 ? _config.Options.Parallelism : Environment.ProcessorCount;
+            parallelism = Math.Clamp(parallelism, 1, Math.Max(1, items.Count));
+            if (parallelism == 1)
+            {
+                foreach (var item in items)
+                    report(item, transfer(item));
+                return;
+            }
+
+            using var gate = new SemaphoreSlim(parallelism);
+            var tasks = items.Select(async item =>
+            {
+                await gate.WaitAsync();
+                try
+                {
+                    return await Task.Run(() =>
+                    {
+                        var output = new StringBuilder();
+                        ibs_compiler_common.CapturedOutput = output;
+                        try { return (Result: transfer(item), Output: output.ToString()); }
+                        finally { ibs_compiler_common.CapturedOutput = null; }
+                    });
+                }
+                finally { gate.Release(); }
+            }).ToList();
+
+            for (int i = 0; i < items.Count; i++)
+            {
+                var (result, output) = tasks[i].GetAwaiter().GetResult();
+                (ibs_compiler_common.OutputToStdErr ? Console.Error : Console.Out).Write(output);
+                report(items[i], result);
+            }
+        }
+
+        private sealed record TableResult(bool Ok, string Text, long Rows = 0);
+
+        // Counts LF-terminated rows (data files are written LF-only) straight off the bytes,
+        // without decoding or allocating a string per row; a final unterminated row counts too.
         private static long CountFileLines(string path)
         {
             if (!File.Exists(path)) return 0;
             long count = 0;
-            using var reader = new StreamReader(path);
-            while (reader.ReadLine() != null) count++;
-            return count;
+            int lastByte = '\n';
+            var buffer = new byte[1 << 16];
+            using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, 1, FileOptions.SequentialScan);
+            int read;
+            while ((read = stream.Read(buffer, 0, buffer.Length)) > 0)
+            {
+                count += buffer.AsSpan(0, read).Count((byte)'\n');
+                lastByte = buffer[read - 1];
+            }
+            return lastByte == '\n' ? count : count + 1;
         }
     }
 }
@@ -104,13 +104,11 @@ watchFile:
 
 var filename = Path.IsPathRooted(args[0]) ? args[0] : Path.GetFullPath(args[0]);
 
-// Wait up to 5 seconds for the file to appear (background process may not have created it yet)
-var waited = 0;
-while (!File.Exists(filename) && waited < 5000)
-{
-    Thread.Sleep(100);
-    waited += 100;
-}
+// Wait up to 5 seconds for the file to appear (background process may not have created it yet).
+// A directory watcher wakes us the moment it is created; polling is only the fallback when the
+// directory doesn't exist yet or the watcher can't be set up.
+if (!File.Exists(filename))
+    WaitForFile(filename, 5000);
 
 if (!File.Exists(filename))
 {
@@ -143,3 +141,34 @@ else
 var proc = System.Diagnostics.Process.Start(psi);
 proc?.WaitForExit();
 return proc?.ExitCode ?? 0;
+
+static void WaitForFile(string path, int timeoutMs)
+{
+    var dir = Path.GetDirectoryName(path);
+    if (!string.IsNullOrEmpty(dir) && Directory.Exists(dir))
+    {
+        try
+        {
+            using var appeared = new ManualResetEventSlim();
+            using var watcher = new FileSystemWatcher(dir, Path.GetFileName(path));
+            watcher.Created += (_, _) => appeared.Set();
+            watcher.Renamed += (_, _) => appeared.Set();
+            watcher.EnableRaisingEvents = true;
+            // Re-check after arming the watcher so a file created in between isn't missed.
+            if (!File.Exists(path))
+                appeared.Wait(timeoutMs);
+            return;
+        }
+        catch (Exception ex) when (ex is IOException or PlatformNotSupportedException or UnauthorizedAccessException)
+        {
+            // e.g. inotify watch limit reached — fall through to polling.
+        }
+    }
+
+    var waited = 0;
+    while (!File.Exists(path) && waited < timeoutMs)
+    {
+        Thread.Sleep(100);
+        waited += 100;
+    }
+}
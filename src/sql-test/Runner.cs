@@ -398,15 +398,18 @@ public class Runner
     private static void CopyResultSetIntoTable(IDataReader reader, AseConnection conn,
                                                 AseTransaction? tx, string insertSql)
     {
+        // One parameterized command per result set; only the bound values
+        // change from row to row.
+        using var insertCmd = new AseCommand(insertSql, conn);
+        if (tx != null) insertCmd.Transaction = tx;
+        var parameters = new AseParameter[reader.FieldCount];
+        for (int i = 0; i < parameters.Length; i++)
+            parameters[i] = insertCmd.Parameters.Add($"@p{i}", DBNull.Value);
+
         while (reader.Read())
         {
-            using var insertCmd = new AseCommand(insertSql, conn);
-            if (tx != null) insertCmd.Transaction = tx;
-            for (int i = 0; i < reader.FieldCount; i++)
-            {
-                var val = reader.IsDBNull(i) ? DBNull.Value : reader.GetValue(i);
-                insertCmd.Parameters.Add($"@p{i}", val);
-            }
+            for (int i = 0; i < parameters.Length; i++)
+                parameters[i].Value = reader.IsDBNull(i) ? DBNull.Value : reader.GetValue(i);
             insertCmd.ExecuteNonQuery();
         }
     }